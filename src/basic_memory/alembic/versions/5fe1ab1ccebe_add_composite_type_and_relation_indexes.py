@@ -0,0 +1,39 @@
+"""add composite entity type and relation target indexes
+
+Revision ID: 5fe1ab1ccebe
+Revises: cc7172b46608
+Create Date: 2026-10-15 09:12:41.508219
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "5fe1ab1ccebe"
+down_revision: Union[str, None] = "cc7172b46608"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # (entity_type, updated_at) serves entity_type filters and recent-by-type ordering,
+    # so it replaces the single column entity_type index
+    op.drop_index("ix_entity_type", table_name="entity")
+    op.create_index(
+        "ix_entity_type_updated_at", "entity", ["entity_type", "updated_at"], unique=False
+    )
+
+    # (to_id, from_id) covers incoming relation lookups without touching the table
+    op.drop_index("ix_relation_to_id", table_name="relation")
+    op.create_index("ix_relation_to_id_from_id", "relation", ["to_id", "from_id"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_relation_to_id_from_id", table_name="relation")
+    op.create_index("ix_relation_to_id", "relation", ["to_id"], unique=False)
+
+    op.drop_index("ix_entity_type_updated_at", table_name="entity")
+    op.create_index("ix_entity_type", "entity", ["entity_type"], unique=False)
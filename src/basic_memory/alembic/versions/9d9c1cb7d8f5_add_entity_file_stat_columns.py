@@ -0,0 +1,31 @@
+"""add entity file stat columns
+
+Revision ID: 9d9c1cb7d8f5
+Revises: 5fe1ab1ccebe
+Create Date: 2026-10-15 14:02:17.330915
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "9d9c1cb7d8f5"
+down_revision: Union[str, None] = "5fe1ab1ccebe"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("entity", schema=None) as batch_op:
+        batch_op.add_column(sa.Column("mtime_ns", sa.Integer(), nullable=True))
+        batch_op.add_column(sa.Column("size", sa.Integer(), nullable=True))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("entity", schema=None) as batch_op:
+        batch_op.drop_column("size")
+        batch_op.drop_column("mtime_ns")
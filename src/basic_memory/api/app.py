@@ -1,31 +1,49 @@
 """FastAPI application for basic-memory knowledge graph API."""
 
 from contextlib import asynccontextmanager
+from typing import Any
 
 from fastapi import FastAPI, HTTPException
 from fastapi.exception_handlers import http_exception_handler
+from fastapi.responses import JSONResponse
 from loguru import logger
+from pydantic_core import to_json
 
 from basic_memory import db
 from basic_memory.config import config as app_config
 from basic_memory.api.routers import knowledge, search, memory, resource, project_info
+from basic_memory.deps import create_search_indexer
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):  # pragma: no cover
     """Lifecycle manager for the FastAPI app."""
     await db.run_migrations(app_config)
+
+    # index entities written through the API in batches shared by concurrent requests
+    _, session_maker = await db.get_or_create_db(app_config.database_path)
+    app.state.search_indexer = await create_search_indexer(app_config, session_maker)
+
     yield
     logger.info("Shutting down Basic Memory API")
+    await app.state.search_indexer.flush()
     await db.shutdown_db()
 
 
+class FastJSONResponse(JSONResponse):
+    """JSON response rendered by pydantic-core's Rust serializer instead of stdlib json."""
+
+    def render(self, content: Any) -> bytes:
+        return to_json(content)
+
+
 # Initialize FastAPI app
 app = FastAPI(
     title="Basic Memory API",
     description="Knowledge graph API for basic-memory",
     version="0.1.0",
     lifespan=lifespan,
+    default_response_class=FastJSONResponse,
 )
 
 
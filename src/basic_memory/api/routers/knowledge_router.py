@@ -4,11 +4,12 @@ from typing import Annotated
 
 from fastapi import APIRouter, HTTPException, BackgroundTasks, Depends, Query, Response
 from loguru import logger
+from pydantic import TypeAdapter
 
 from basic_memory.deps import (
     EntityServiceDep,
     get_search_service,
-    SearchServiceDep,
+    SearchIndexerDep,
     LinkResolverDep,
 )
 from basic_memory.schemas import (
@@ -22,15 +23,17 @@ from basic_memory.services.exceptions import EntityNotFoundError
 
 router = APIRouter(prefix="/knowledge", tags=["knowledge"])
 
+# validates a whole list of ORM entities in a single call into pydantic-core
+entity_list_adapter = TypeAdapter(list[EntityResponse])
+
 ## Create endpoints
 
 
 @router.post("/entities", response_model=EntityResponse)
 async def create_entity(
     data: Entity,
-    background_tasks: BackgroundTasks,
     entity_service: EntityServiceDep,
-    search_service: SearchServiceDep,
+    search_indexer: SearchIndexerDep,
 ) -> EntityResponse:
     """Create an entity."""
     logger.info(
@@ -39,8 +42,8 @@ async def create_entity(
 
     entity = await entity_service.create_entity(data)
 
-    # reindex
-    await search_service.index_entity(entity, background_tasks=background_tasks)
+    # reindex, batched with the entities of concurrent requests
+    await search_indexer.enqueue(entity)
     result = EntityResponse.model_validate(entity)
 
     logger.info(
@@ -58,9 +61,8 @@ async def create_or_update_entity(
     permalink: Permalink,
     data: Entity,
     response: Response,
-    background_tasks: BackgroundTasks,
     entity_service: EntityServiceDep,
-    search_service: SearchServiceDep,
+    search_indexer: SearchIndexerDep,
 ) -> EntityResponse:
     """Create or update an entity. If entity exists, it will be updated, otherwise created."""
     logger.info(
@@ -86,8 +88,8 @@ async def create_or_update_entity(
     entity, created = await entity_service.create_or_update_entity(data)
     response.status_code = 201 if created else 200
 
-    # reindex
-    await search_service.index_entity(entity, background_tasks=background_tasks)
+    # reindex, batched with the entities of concurrent requests
+    await search_indexer.enqueue(entity)
     result = EntityResponse.model_validate(entity)
 
     logger.info(
@@ -135,7 +137,7 @@ async def get_entities(
 
     entities = await entity_service.get_entities_by_permalinks(permalink) if permalink else []
     result = EntityListResponse(
-        entities=[EntityResponse.model_validate(entity) for entity in entities]
+        entities=entity_list_adapter.validate_python(entities, from_attributes=True)
     )
     return result
 
@@ -162,7 +164,7 @@ async def delete_entity(
     deleted = await entity_service.delete_entity(entity.permalink or entity.id)
 
     # Remove from search index
-    background_tasks.add_task(search_service.delete_by_permalink, entity.permalink)
+    background_tasks.add_task(search_service.delete_entities, [entity])
 
     result = DeleteEntitiesResponse(deleted=deleted)
     return result
@@ -179,10 +181,13 @@ async def delete_entities(
     logger.info(f"request: delete_entities with data={data}")
     deleted = False
 
-    # Remove each deleted entity from search index
+    # Load the entities first so their index entries can be found after deletion
+    entities = await entity_service.get_entities_by_permalinks(data.permalinks)
     for permalink in data.permalinks:
         deleted = await entity_service.delete_entity(permalink)
-        background_tasks.add_task(search_service.delete_by_permalink, permalink)
+
+    # Remove all deleted entities from the search index in one batch
+    background_tasks.add_task(search_service.delete_entities, entities)
 
     result = DeleteEntitiesResponse(deleted=deleted)
     return result
@@ -55,23 +55,6 @@ async def get_project_info(
 
 async def get_statistics(repository: ProjectInfoRepository) -> ProjectStatistics:
     """Get statistics about the current project."""
-    # Get basic counts
-    entity_count_result = await repository.execute_query(text("SELECT COUNT(*) FROM entity"))
-    total_entities = entity_count_result.scalar() or 0
-
-    observation_count_result = await repository.execute_query(
-        text("SELECT COUNT(*) FROM observation")
-    )
-    total_observations = observation_count_result.scalar() or 0
-
-    relation_count_result = await repository.execute_query(text("SELECT COUNT(*) FROM relation"))
-    total_relations = relation_count_result.scalar() or 0
-
-    unresolved_count_result = await repository.execute_query(
-        text("SELECT COUNT(*) FROM relation WHERE to_id IS NULL")
-    )
-    total_unresolved = unresolved_count_result.scalar() or 0
-
     # Get entity counts by type
     entity_types_result = await repository.execute_query(
         text("SELECT entity_type, COUNT(*) FROM entity GROUP BY entity_type")
@@ -84,11 +67,22 @@ async def get_statistics(repository: ProjectInfoRepository) -> ProjectStatistics
     )
     observation_categories = {row[0]: row[1] for row in category_result.fetchall()}
 
-    # Get relation counts by type
+    # Get relation counts by type, and unresolved relations in the same pass
     relation_types_result = await repository.execute_query(
-        text("SELECT relation_type, COUNT(*) FROM relation GROUP BY relation_type")
+        text("""
+        SELECT relation_type, COUNT(*), SUM(CASE WHEN to_id IS NULL THEN 1 ELSE 0 END)
+        FROM relation
+        GROUP BY relation_type
+    """)
     )
-    relation_types = {row[0]: row[1] for row in relation_types_result.fetchall()}
+    relation_type_rows = relation_types_result.fetchall()
+    relation_types = {row[0]: row[1] for row in relation_type_rows}
+    total_unresolved = sum(row[2] for row in relation_type_rows)
+
+    # Totals are the sums of the grouped counts, no separate COUNT(*) scans needed
+    total_entities = sum(entity_types.values())
+    total_observations = sum(observation_categories.values())
+    total_relations = sum(relation_types.values())
 
     # Find most connected entities (most outgoing relations)
     connected_result = await repository.execute_query(
@@ -76,6 +76,8 @@ async def get_sync_service():  # pragma: no cover
         relation_repository=relation_repository,
         search_service=search_service,
         file_service=file_service,
+        index_batch_size=config.sync_index_batch_size,
+        index_debounce_ms=config.sync_index_debounce,
     )
 
     return sync_service
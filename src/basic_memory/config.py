@@ -38,6 +38,16 @@ class ProjectConfig(BaseSettings):
         default=500, description="Milliseconds to wait after changes before syncing", gt=0
     )
 
+    # Search indexing during sync
+    sync_index_batch_size: int = Field(
+        default=200, description="Maximum number of entities per search index write", gt=0
+    )
+    sync_index_debounce: int = Field(
+        default=50,
+        description="Milliseconds to wait for more entities before writing a search index batch",
+        ge=0,
+    )
+
     log_level: str = "DEBUG"
 
     model_config = SettingsConfigDict(
@@ -10,7 +10,7 @@ from alembic import command
 from alembic.config import Config
 
 from loguru import logger
-from sqlalchemy import text
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import (
     create_async_engine,
     async_sessionmaker,
@@ -62,7 +62,6 @@ async def scoped_session(
     factory = get_scoped_session_factory(session_maker)
     session = factory()
     try:
-        await session.execute(text("PRAGMA foreign_keys=ON"))
         yield session
         await session.commit()
     except Exception:
@@ -73,6 +72,26 @@ async def scoped_session(
         await factory.remove()
 
 
+def configure_sqlite_connections(engine: AsyncEngine, db_type: DatabaseType) -> None:
+    """Apply connection-level SQLite settings once per new connection.
+
+    Foreign keys are enforced on every connection. File databases also use WAL
+    so readers don't block the writer, with synchronous=NORMAL (safe in WAL mode),
+    in-memory temp tables and memory-mapped reads.
+    """
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        if db_type == DatabaseType.FILESYSTEM:
+            cursor.execute("PRAGMA journal_mode=WAL")
+            cursor.execute("PRAGMA synchronous=NORMAL")
+            cursor.execute("PRAGMA temp_store=MEMORY")
+            cursor.execute("PRAGMA mmap_size=268435456")
+        cursor.close()
+
+
 async def get_or_create_db(
     db_path: Path,
     db_type: DatabaseType = DatabaseType.FILESYSTEM,
@@ -84,6 +103,7 @@ async def get_or_create_db(
         db_url = DatabaseType.get_db_url(db_path, db_type)
         logger.debug(f"Creating engine for db_url: {db_url}")
         _engine = create_async_engine(db_url, connect_args={"check_same_thread": False})
+        configure_sqlite_connections(_engine, db_type)
         _session_maker = async_sessionmaker(_engine, expire_on_commit=False)
 
     # These checks should never fail since we just created the engine and session maker
@@ -126,6 +146,7 @@ async def engine_session_factory(
     logger.debug(f"Creating engine for db_url: {db_url}")
 
     _engine = create_async_engine(db_url, connect_args={"check_same_thread": False})
+    configure_sqlite_connections(_engine, db_type)
     try:
         _session_maker = async_sessionmaker(_engine, expire_on_commit=False)
 
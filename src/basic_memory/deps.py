@@ -2,7 +2,7 @@
 
 from typing import Annotated
 
-from fastapi import Depends
+from fastapi import Depends, Request
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
     AsyncEngine,
@@ -24,7 +24,7 @@ from basic_memory.services import (
 from basic_memory.services.context_service import ContextService
 from basic_memory.services.file_service import FileService
 from basic_memory.services.link_resolver import LinkResolver
-from basic_memory.services.search_service import SearchService
+from basic_memory.services.search_service import AutoBatchIndexer, SearchService
 
 
 ## project
@@ -174,6 +174,41 @@ async def get_search_service(
 SearchServiceDep = Annotated[SearchService, Depends(get_search_service)]
 
 
+async def create_search_indexer(
+    project_config: ProjectConfig, session_maker: async_sessionmaker[AsyncSession]
+) -> AutoBatchIndexer:
+    """Create the app-scoped search indexer, called once by the app lifespan.
+
+    API requests wait for their own entities to be indexed, so the indexer does not
+    debounce. It writes the entities of all requests waiting at the same time in one batch.
+    """
+    entity_parser = await get_entity_parser(project_config)
+    file_service = await get_file_service(
+        project_config, await get_markdown_processor(entity_parser)
+    )
+    search_service = await get_search_service(
+        await get_search_repository(session_maker),
+        await get_entity_repository(session_maker),
+        file_service,
+    )
+    return AutoBatchIndexer(
+        search_service, max_batch_size=project_config.sync_index_batch_size, debounce_duration=0
+    )
+
+
+def get_search_indexer(request: Request, search_service: SearchServiceDep) -> AutoBatchIndexer:
+    """Get the search indexer started by the app lifespan.
+
+    Without a lifespan, e.g. when the app is driven through ASGITransport, the request gets an
+    indexer of its own, so its entities are indexed before it returns.
+    """
+    search_indexer = getattr(request.app.state, "search_indexer", None)
+    return search_indexer or AutoBatchIndexer(search_service, debounce_duration=0)
+
+
+SearchIndexerDep = Annotated[AutoBatchIndexer, Depends(get_search_indexer)]
+
+
 async def get_link_resolver(
     entity_repository: EntityRepositoryDep, search_service: SearchServiceDep
 ) -> LinkResolver:
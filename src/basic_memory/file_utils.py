@@ -50,6 +50,29 @@ async def compute_checksum(content: Union[str, bytes]) -> str:
         raise FileError(f"Failed to compute checksum: {e}")
 
 
+def compute_file_checksum(path: Path, text: bool = False) -> str:
+    """
+    Compute SHA-256 checksum of a file's content.
+
+    This blocks while reading and hashing, callers on the event loop should run it in a
+    thread. hashlib releases the GIL while hashing.
+
+    Args:
+        path: Path to the file
+        text: Hash the file read as utf-8 text, so line endings are normalized the
+            same way as content read with read_text()
+
+    Returns:
+        SHA-256 hex digest
+    """
+    if text:
+        return hashlib.sha256(path.read_text(encoding="utf-8").encode()).hexdigest()
+
+    # binary files are hashed in chunks without reading the whole file into memory
+    with open(path, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
 async def ensure_directory(path: FilePath) -> None:
     """
     Ensure directory exists, creating if necessary.
@@ -3,10 +3,11 @@
 Uses markdown-it with plugins to parse structured data from markdown content.
 """
 
+import asyncio
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Optional, Tuple
 
 import dateparser
 import frontmatter
@@ -91,13 +92,24 @@ class EntityParser:
 
     async def parse_file(self, path: Path | str) -> EntityMarkdown:
         """Parse markdown file into EntityMarkdown."""
+        entity_markdown, _ = await self.parse_file_with_text(path)
+        return entity_markdown
+
+    async def parse_file_with_text(self, path: Path | str) -> Tuple[EntityMarkdown, str]:
+        """Parse markdown file into EntityMarkdown, also returning the text it was parsed from.
+
+        Callers that need a checksum matching the parsed content hash this text instead of
+        reading the file again, which could pick up a later edit.
+        """
 
         absolute_path = self.base_path / path
-        # Parse frontmatter and content using python-frontmatter
-        post = frontmatter.load(str(absolute_path))
 
-        # Extract file stat info
-        file_stats = absolute_path.stat()
+        # Read the file off the event loop so many files can be parsed concurrently
+        text = await asyncio.to_thread(absolute_path.read_text, encoding="utf-8")
+        file_stats = await asyncio.to_thread(absolute_path.stat)
+
+        # Parse frontmatter and content using python-frontmatter
+        post = frontmatter.loads(text)
 
         metadata = post.metadata
         metadata["title"] = post.metadata.get("title", absolute_path.name)
@@ -113,7 +125,7 @@ class EntityParser:
 
         entity_content = parse(post.content)
 
-        return EntityMarkdown(
+        entity_markdown = EntityMarkdown(
             frontmatter=entity_frontmatter,
             content=post.content,
             observations=entity_content.observations,
@@ -121,3 +133,4 @@ class EntityParser:
             created=datetime.fromtimestamp(file_stats.st_ctime),
             modified=datetime.fromtimestamp(file_stats.st_mtime),
         )
+        return entity_markdown, text
@@ -6,7 +6,7 @@ from loguru import logger
 
 from basic_memory.mcp.async_client import client
 from basic_memory.mcp.server import mcp
-from basic_memory.mcp.tools.utils import call_post
+from basic_memory.mcp.tools.utils import call_post_json
 from basic_memory.schemas.search import SearchItemType, SearchQuery, SearchResponse
 
 
@@ -104,10 +104,10 @@ async def search_notes(
         search_query.after_date = after_date
 
     logger.info(f"Searching for {search_query}")
-    response = await call_post(
+    response = await call_post_json(
         client,
         "/search/",
-        json=search_query.model_dump(),
+        search_query,
         params={"page": page, "page_size": page_size},
     )
     return SearchResponse.model_validate(response.json())
@@ -21,6 +21,9 @@ from httpx._types import (
 )
 from loguru import logger
 from mcp.server.fastmcp.exceptions import ToolError
+from pydantic import BaseModel
+
+JSON_HEADERS = {"content-type": "application/json"}
 
 
 def get_error_message(status_code: int, url: URL | str, method: str) -> str:
@@ -381,3 +384,36 @@ async def call_delete(
         status_code = e.response.status_code
         error_message = get_error_message(status_code, url, "DELETE")
         raise ToolError(error_message) from e
+
+
+async def call_put_json(
+    client: AsyncClient,
+    url: URL | str,
+    model: BaseModel,
+    *,
+    params: QueryParamTypes | None = None,
+) -> Response:
+    """Make a PUT request with a pydantic model as the JSON body.
+
+    The body is written by pydantic-core in a single pass, instead of dumping the model
+    to a dict that httpx then encodes again with the stdlib json module.
+    """
+    return await call_put(
+        client, url, content=model.model_dump_json(), params=params, headers=JSON_HEADERS
+    )
+
+
+async def call_post_json(
+    client: AsyncClient,
+    url: URL | str,
+    model: BaseModel,
+    *,
+    params: QueryParamTypes | None = None,
+) -> Response:
+    """Make a POST request with a pydantic model as the JSON body.
+
+    See call_put_json.
+    """
+    return await call_post(
+        client, url, content=model.model_dump_json(), params=params, headers=JSON_HEADERS
+    )
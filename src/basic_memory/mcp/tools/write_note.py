@@ -6,7 +6,7 @@ from loguru import logger
 
 from basic_memory.mcp.async_client import client
 from basic_memory.mcp.server import mcp
-from basic_memory.mcp.tools.utils import call_put
+from basic_memory.mcp.tools.utils import call_put_json
 from basic_memory.schemas import EntityResponse
 from basic_memory.schemas.base import Entity
 from basic_memory.utils import parse_tags
@@ -82,7 +82,7 @@ async def write_note(
     # Create or update via knowledge API
     logger.debug("Creating entity via API", permalink=entity.permalink)
     url = f"/knowledge/entities/{entity.permalink}"
-    response = await call_put(client, url, json=entity.model_dump())
+    response = await call_put_json(client, url, entity)
     result = EntityResponse.model_validate(response.json())
 
     # Format semantic summary based on status code
@@ -34,7 +34,7 @@ class Entity(Base):
     __tablename__ = "entity"
     __table_args__ = (
         # Regular indexes
-        Index("ix_entity_type", "entity_type"),
+        Index("ix_entity_type_updated_at", "entity_type", "updated_at"),
         Index("ix_entity_title", "title"),
         Index("ix_entity_created_at", "created_at"),  # For timeline queries
         Index("ix_entity_updated_at", "updated_at"),  # For timeline queries
@@ -60,6 +60,10 @@ class Entity(Base):
     file_path: Mapped[str] = mapped_column(String, unique=True, index=True)
     # checksum of file
     checksum: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+    # file modification time and size when the checksum was computed, so unchanged
+    # files can be skipped without hashing them
+    mtime_ns: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    size: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
 
     # Metadata and tracking
     created_at: Mapped[datetime] = mapped_column(DateTime)
@@ -146,7 +150,7 @@ class Relation(Base):
         ),
         Index("ix_relation_type", "relation_type"),
         Index("ix_relation_from_id", "from_id"),  # Add FK indexes
-        Index("ix_relation_to_id", "to_id"),
+        Index("ix_relation_to_id_from_id", "to_id", "from_id"),
     )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
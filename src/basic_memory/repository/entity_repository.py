@@ -3,10 +3,12 @@
 from pathlib import Path
 from typing import List, Optional, Sequence, Union
 
+from sqlalchemy import Row, select
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload, selectinload
 from sqlalchemy.orm.interfaces import LoaderOption
 
+from basic_memory import db
 from basic_memory.models.knowledge import Entity, Observation, Relation
 from basic_memory.repository.repository import Repository
 
@@ -65,13 +67,14 @@ class EntityRepository(Repository[Entity]):
     def get_load_options(self) -> List[LoaderOption]:
         """Get SQLAlchemy loader options for eager loading relationships."""
         return [
-            selectinload(Entity.observations).selectinload(Observation.entity),
-            # Load from_relations and both entities for each relation
-            selectinload(Entity.outgoing_relations).selectinload(Relation.from_entity),
-            selectinload(Entity.outgoing_relations).selectinload(Relation.to_entity),
-            # Load to_relations and both entities for each relation
-            selectinload(Entity.incoming_relations).selectinload(Relation.from_entity),
-            selectinload(Entity.incoming_relations).selectinload(Relation.to_entity),
+            selectinload(Entity.observations).joinedload(Observation.entity),
+            # Relations and the entities on both ends load in one query per direction
+            selectinload(Entity.outgoing_relations).options(
+                joinedload(Relation.from_entity), joinedload(Relation.to_entity)
+            ),
+            selectinload(Entity.incoming_relations).options(
+                joinedload(Relation.from_entity), joinedload(Relation.to_entity)
+            ),
         ]
 
     async def find_by_permalinks(self, permalinks: List[str]) -> Sequence[Entity]:
@@ -84,10 +87,14 @@ class EntityRepository(Repository[Entity]):
         if not permalinks:
             return []
 
-        # Use existing select pattern
-        query = (
-            self.select().options(*self.get_load_options()).where(Entity.permalink.in_(permalinks))
-        )
+        async with db.scoped_session(self.session_maker) as session:
+            return list(await self.select_in(session, Entity.permalink, permalinks))
 
-        result = await self.execute_query(query)
-        return list(result.scalars().all())
+    async def get_file_states(self) -> Sequence[Row]:
+        """Get file_path, checksum, mtime_ns and size of every entity.
+
+        Only these columns are selected, entities and their relations are not loaded.
+        """
+        query = select(Entity.file_path, Entity.checksum, Entity.mtime_ns, Entity.size)
+        result = await self.execute_query(query, use_query_options=False)
+        return result.all()
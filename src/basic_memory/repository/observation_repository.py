@@ -1,10 +1,11 @@
 """Repository for managing Observation objects."""
 
-from typing import Sequence
+from typing import List, Sequence
 
-from sqlalchemy import select
+from sqlalchemy import delete, insert, select
 from sqlalchemy.ext.asyncio import async_sessionmaker
 
+from basic_memory import db
 from basic_memory.models import Observation
 from basic_memory.repository.repository import Repository
 
@@ -21,6 +22,34 @@ class ObservationRepository(Repository[Observation]):
         result = await self.execute_query(query)
         return result.scalars().all()
 
+    async def replace_entity_observations(self, entity_id: int, observations: List[dict]) -> int:
+        """Replace all observations of an entity in one transaction.
+
+        The old observations are deleted and the new ones inserted with a single
+        executemany statement, without loading any of them back.
+
+        Returns:
+            Number of observations inserted
+        """
+        async with db.scoped_session(self.session_maker) as session:
+            await session.execute(delete(Observation).where(Observation.entity_id == entity_id))
+            if not observations:
+                return 0
+
+            # every row needs the same keys for a single executemany insert
+            rows = [
+                {
+                    "entity_id": entity_id,
+                    "content": obs["content"],
+                    "category": obs.get("category") or "note",
+                    "context": obs.get("context"),
+                    "tags": obs.get("tags") or [],
+                }
+                for obs in observations
+            ]
+            result = await session.execute(insert(Observation.__table__), rows)  # pyright: ignore
+            return result.rowcount  # pyright: ignore [reportAttributeAccessIssue]
+
     async def find_by_context(self, context: str) -> Sequence[Observation]:
         """Find observations with a specific context."""
         query = select(Observation).filter(Observation.context == context)
@@ -4,8 +4,9 @@ from sqlalchemy import and_, delete
 from typing import Sequence, List, Optional
 
 from sqlalchemy import select
+from sqlalchemy.dialects.sqlite import insert
 from sqlalchemy.ext.asyncio import async_sessionmaker
-from sqlalchemy.orm import selectinload, aliased
+from sqlalchemy.orm import joinedload, aliased
 from sqlalchemy.orm.interfaces import LoaderOption
 
 from basic_memory import db
@@ -61,6 +62,28 @@ class RelationRepository(Repository[Relation]):
         async with db.scoped_session(self.session_maker) as session:
             await session.execute(delete(Relation).where(Relation.from_id == entity_id))
 
+    async def add_all_ignore_duplicates(self, relations: List[dict]) -> int:
+        """Insert relations in a single statement, skipping any that already exist.
+
+        Rows that violate a unique constraint (the same relation listed twice in a
+        file) are ignored instead of failing the whole insert.
+
+        Returns:
+            Number of relations inserted
+        """
+        if not relations:
+            return 0
+
+        async with db.scoped_session(self.session_maker) as session:
+            # every row needs the same keys for a single executemany insert
+            columns = [c for c in self.valid_columns if c != "id"]
+            rows = [{c: r.get(c) for c in columns} for r in relations]
+            result = await session.execute(
+                insert(Relation.__table__).on_conflict_do_nothing(),  # pyright: ignore
+                rows,
+            )
+            return result.rowcount  # pyright: ignore [reportAttributeAccessIssue]
+
     async def find_unresolved_relations(self) -> Sequence[Relation]:
         """Find all unresolved relations, where to_id is null."""
         query = select(Relation).filter(Relation.to_id.is_(None))
@@ -68,4 +91,5 @@ class RelationRepository(Repository[Relation]):
         return result.scalars().all()
 
     def get_load_options(self) -> List[LoaderOption]:
-        return [selectinload(Relation.from_entity), selectinload(Relation.to_entity)]
+        # both ends are many-to-one, so they join into the relation query itself
+        return [joinedload(Relation.from_entity), joinedload(Relation.to_entity)]
@@ -1,6 +1,6 @@
 """Base repository implementation."""
 
-from typing import Type, Optional, Any, Sequence, TypeVar, List
+from typing import AsyncIterator, Type, Optional, Any, Sequence, TypeVar, List
 
 from loguru import logger
 from sqlalchemy import (
@@ -13,6 +13,7 @@ from sqlalchemy import (
     Column,
     and_,
     delete,
+    insert,
 )
 from sqlalchemy.exc import NoResultFound
 from sqlalchemy.ext.asyncio import async_sessionmaker, AsyncSession
@@ -20,9 +21,14 @@ from sqlalchemy.orm.interfaces import LoaderOption
 
 from basic_memory import db
 from basic_memory.models import Base
+from basic_memory.utils import chunked
 
 T = TypeVar("T", bound=Base)
 
+# Max values bound in a single IN (...) clause. SQLite builds before 3.32 allow
+# only 999 bound parameters per statement.
+IN_CLAUSE_CHUNK_SIZE = 500
+
 
 class Repository[T: Base]:
     """Base repository implementation with generic CRUD operations."""
@@ -53,11 +59,22 @@ class Repository[T: Base]:
 
     async def select_by_ids(self, session: AsyncSession, ids: List[int]) -> Sequence[T]:
         """Select multiple entities by IDs using an existing session."""
-        query = (
-            select(self.Model).where(self.primary_key.in_(ids)).options(*self.get_load_options())
-        )
-        result = await session.execute(query)
-        return result.scalars().all()
+        return await self.select_in(session, self.primary_key, ids)
+
+    async def select_in(
+        self, session: AsyncSession, column: Any, values: Sequence[Any]
+    ) -> Sequence[T]:
+        """Select models where `column` is in `values`, with eager load options.
+
+        Large value lists are queried in chunks so no statement exceeds SQLite's
+        bound parameter limit.
+        """
+        items: List[T] = []
+        for chunk in chunked(values, IN_CLAUSE_CHUNK_SIZE):
+            query = select(self.Model).where(column.in_(chunk)).options(*self.get_load_options())
+            result = await session.execute(query)
+            items.extend(result.scalars().all())
+        return items
 
     async def add(self, model: T) -> T:
         """
@@ -121,6 +138,23 @@ class Repository[T: Base]:
             logger.debug(f"Found {len(items)} {self.Model.__name__} records")
             return items
 
+    async def stream_all(self, batch_size: int = 500) -> AsyncIterator[Sequence[T]]:
+        """Stream all records in batches of `batch_size`, with eager load options.
+
+        Rows are fetched from a cursor as they are consumed, so only one batch is held
+        in memory at a time instead of the whole table.
+        """
+        async with db.scoped_session(self.session_maker) as session:
+            query = (
+                select(self.Model)
+                .order_by(self.primary_key)
+                .options(*self.get_load_options())
+                .execution_options(yield_per=batch_size)
+            )
+            result = await session.stream_scalars(query)
+            async for batch in result.partitions():
+                yield batch
+
     async def find_by_id(self, entity_id: int) -> Optional[T]:
         """Fetch an entity by its unique identifier."""
         logger.debug(f"Finding {self.Model.__name__} by ID: {entity_id}")
@@ -176,18 +210,17 @@ class Repository[T: Base]:
         """Create multiple records in a single transaction."""
         logger.debug(f"Bulk creating {len(data_list)} {self.Model.__name__} instances")
 
+        if not data_list:
+            return []
+
         async with db.scoped_session(self.session_maker) as session:
-            # Only include valid columns that are provided in entity_data
-            model_list = [
-                self.Model(
-                    **self.get_model_data(d),
-                )
-                for d in data_list
-            ]
-            session.add_all(model_list)
-            await session.flush()
+            # Only include valid columns that are provided in entity_data.
+            # A single bulk INSERT ... RETURNING replaces one INSERT per row.
+            rows = [self.get_model_data(d) for d in data_list]
+            result = await session.execute(insert(self.Model).returning(self.primary_key), rows)
+            ids = list(result.scalars().all())
 
-            return await self.select_by_ids(session, [model.id for model in model_list])  # pyright: ignore [reportAttributeAccessIssue]
+            return await self.select_by_ids(session, ids)
 
     async def update(self, entity_id: int, entity_data: dict | T) -> Optional[T]:
         """Update an entity with the given data."""
@@ -239,10 +272,13 @@ class Repository[T: Base]:
         """Delete records matching given IDs."""
         logger.debug(f"Deleting {self.Model.__name__} by ids: {ids}")
         async with db.scoped_session(self.session_maker) as session:
-            query = delete(self.Model).where(self.primary_key.in_(ids))
-            result = await session.execute(query)
-            logger.debug(f"Deleted {result.rowcount} records")
-            return result.rowcount
+            deleted = 0
+            for chunk in chunked(ids, IN_CLAUSE_CHUNK_SIZE):
+                query = delete(self.Model).where(self.primary_key.in_(chunk))
+                result = await session.execute(query)
+                deleted += result.rowcount
+            logger.debug(f"Deleted {deleted} records")
+            return deleted
 
     async def delete_by_fields(self, **filters: Any) -> bool:
         """Delete records matching given field values."""
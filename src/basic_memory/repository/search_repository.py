@@ -4,15 +4,21 @@ import json
 import time
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence
 
 from loguru import logger
-from sqlalchemy import Executable, Result, text
+from sqlalchemy import Executable, Result, bindparam, text
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from basic_memory import db
 from basic_memory.models.search import CREATE_SEARCH_INDEX
+from basic_memory.repository.repository import IN_CLAUSE_CHUNK_SIZE
 from basic_memory.schemas.search import SearchItemType
+from basic_memory.utils import chunked
+
+# bm25() column weights, in search_index column order: id, title, content_stems,
+# content_snippet, permalink. A hit in the title counts for more than one in the body.
+BM25_WEIGHTS = "0.0, 10.0, 1.0, 1.0, 1.0"
 
 
 @dataclass
@@ -143,19 +149,22 @@ class SearchRepository:
             if has_boolean:
                 # If boolean operators are present, use the raw query
                 # No need to prepare it, FTS5 will understand the operators
-                params["text"] = search_text
-                conditions.append("(title MATCH :text OR content_stems MATCH :text)")
+                processed_text = search_text
             else:
                 # Standard search with term preparation
                 processed_text = self._prepare_search_term(search_text.strip())
-                params["text"] = processed_text
-                conditions.append("(title MATCH :text OR content_stems MATCH :text)")
+
+            # One MATCH over the table is a single full-text lookup, where OR-ing two column
+            # MATCHes needs one per column. Each column filter must match the whole query on
+            # its own, so terms split between title and content still don't match.
+            params["text"] = f"title : ({processed_text}) OR content_stems : ({processed_text})"
+            conditions.append("search_index MATCH :text")
 
         # Handle title match search
         if title:
             title_text = self._prepare_search_term(title.strip())
-            params["text"] = title_text
-            conditions.append("title MATCH :text")
+            params["title_text"] = title_text
+            conditions.append("title MATCH :title_text")
 
         # Handle permalink exact search
         if permalink:
@@ -215,7 +224,7 @@ class SearchRepository:
                 category,
                 created_at,
                 updated_at,
-                bm25(search_index) as score
+                bm25(search_index, {BM25_WEIGHTS}) as score
             FROM search_index 
             WHERE {where_clause}
             ORDER BY score ASC {order_by_clause}
@@ -289,6 +298,59 @@ class SearchRepository:
             logger.debug(f"indexed row {search_index_row}")
             await session.commit()
 
+    async def delete_in(self, session: AsyncSession, column: str, values: Sequence[Any]):
+        """Delete rows where `column` is in `values`, within the caller's session.
+
+        Large value lists are deleted in chunks so no statement exceeds SQLite's
+        bound parameter limit.
+        """
+        statement = text(f"DELETE FROM search_index WHERE {column} IN :values").bindparams(
+            bindparam("values", expanding=True)
+        )
+        for chunk in chunked(values, IN_CLAUSE_CHUNK_SIZE):
+            await session.execute(statement, {"values": chunk})
+
+    async def bulk_index_items(
+        self, search_index_rows: List[SearchIndexRow], entity_ids: Sequence[int] = ()
+    ):
+        """Index or update multiple items in a single transaction.
+
+        All rows of the given entity_ids and existing rows with matching permalinks are
+        removed, then the new rows are written with a single executemany INSERT. Because it
+        all happens in one transaction, a failure leaves the previous rows in place.
+        """
+        if not search_index_rows and not entity_ids:
+            return
+
+        async with db.scoped_session(self.session_maker) as session:
+            await self.delete_in(session, "entity_id", entity_ids)
+
+            if not search_index_rows:
+                await session.commit()
+                return
+
+            permalinks = [row.permalink for row in search_index_rows if row.permalink]
+            await self.delete_in(session, "permalink", permalinks)
+
+            await session.execute(
+                text("""
+                    INSERT INTO search_index (
+                        id, title, content_stems, content_snippet, permalink, file_path, type, metadata,
+                        from_id, to_id, relation_type,
+                        entity_id, category,
+                        created_at, updated_at
+                    ) VALUES (
+                        :id, :title, :content_stems, :content_snippet, :permalink, :file_path, :type, :metadata,
+                        :from_id, :to_id, :relation_type,
+                        :entity_id, :category,
+                        :created_at, :updated_at
+                    )
+                """),
+                [row.to_insert() for row in search_index_rows],
+            )
+            logger.debug(f"indexed {len(search_index_rows)} rows")
+            await session.commit()
+
     async def delete_by_entity_id(self, entity_id: int):
         """Delete an item from the search index by entity_id."""
         async with db.scoped_session(self.session_maker) as session:
@@ -298,6 +360,15 @@ class SearchRepository:
             )
             await session.commit()
 
+    async def delete_by_entity_ids(self, entity_ids: List[int]):
+        """Delete all items from the search index for the given entity_ids."""
+        if not entity_ids:
+            return
+
+        async with db.scoped_session(self.session_maker) as session:
+            await self.delete_in(session, "entity_id", entity_ids)
+            await session.commit()
+
     async def delete_by_permalink(self, permalink: str):
         """Delete an item from the search index."""
         async with db.scoped_session(self.session_maker) as session:
@@ -307,6 +378,15 @@ class SearchRepository:
             )
             await session.commit()
 
+    async def delete_by_permalinks(self, permalinks: List[str]):
+        """Delete all items with the given permalinks from the search index."""
+        if not permalinks:
+            return
+
+        async with db.scoped_session(self.session_maker) as session:
+            await self.delete_in(session, "permalink", permalinks)
+            await session.commit()
+
     async def execute_query(
         self,
         query: Executable,
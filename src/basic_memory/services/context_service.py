@@ -177,7 +177,9 @@ class ContextService:
             WHERE (base.type, base.id) IN ({values})
             {date_filter}
 
-            UNION ALL  -- Allow same paths at different depths
+            -- UNION, not UNION ALL: a row reached again by another path at the same depth
+            -- is dropped, so it is not expanded again. Different depths are still kept.
+            UNION
 
             -- Get relations from current entities 
             SELECT DISTINCT
@@ -206,7 +208,7 @@ class ContextService:
             )
             WHERE cg.depth < :max_depth
 
-            UNION ALL
+            UNION
 
             -- Get entities connected by relations
             SELECT DISTINCT
@@ -238,7 +240,9 @@ class ContextService:
             )
             WHERE cg.depth < :max_depth
         )
-        SELECT DISTINCT 
+        -- One row per item, reached from any root. With a MIN() aggregate SQLite takes
+        -- the bare columns from the row with the minimum, so the shallowest copy wins.
+        SELECT
             type,
             id,
             title,
@@ -255,10 +259,7 @@ class ContextService:
             created_at
         FROM context_graph
         WHERE (type, id) NOT IN ({values})
-        GROUP BY
-            type, id, title, permalink, from_id, to_id,
-            relation_type, category, entity_id,
-            root_id, created_at
+        GROUP BY type, id
         ORDER BY depth, type, id
         LIMIT :max_results
        """)
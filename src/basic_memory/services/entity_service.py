@@ -1,15 +1,14 @@
 """Service for managing entities in the database."""
 
 from pathlib import Path
-from typing import Sequence, List, Optional, Tuple, Union
+from typing import Dict, Sequence, List, Optional, Tuple, Union
 
 import frontmatter
 from loguru import logger
-from sqlalchemy.exc import IntegrityError
 
 from basic_memory.markdown import EntityMarkdown
 from basic_memory.markdown.utils import entity_model_from_markdown, schema_to_markdown
-from basic_memory.models import Entity as EntityModel, Observation, Relation
+from basic_memory.models import Entity as EntityModel
 from basic_memory.repository import ObservationRepository, RelationRepository
 from basic_memory.repository.entity_repository import EntityRepository
 from basic_memory.schemas import Entity as EntitySchema
@@ -249,21 +248,19 @@ class EntityService(BaseService[EntityModel]):
 
         db_entity = await self.repository.get_by_file_path(str(file_path))
 
-        # Clear observations for entity
-        await self.observation_repository.delete_by_fields(entity_id=db_entity.id)
-
-        # add new observations
-        observations = [
-            Observation(
-                entity_id=db_entity.id,
-                content=obs.content,
-                category=obs.category,
-                context=obs.context,
-                tags=obs.tags,
-            )
-            for obs in markdown.observations
-        ]
-        await self.observation_repository.add_all(observations)
+        # Replace the entity's observations with the ones from the file
+        await self.observation_repository.replace_entity_observations(
+            db_entity.id,
+            [
+                {
+                    "content": obs.content,
+                    "category": obs.category,
+                    "context": obs.context,
+                    "tags": obs.tags,
+                }
+                for obs in markdown.observations
+            ],
+        )
 
         # update values from markdown
         db_entity = entity_model_from_markdown(file_path, markdown, db_entity)
@@ -290,33 +287,35 @@ class EntityService(BaseService[EntityModel]):
         # Clear existing relations first
         await self.relation_repository.delete_outgoing_relations_from_entity(db_entity.id)
 
-        # Process each relation
+        # Process each relation, resolving each distinct target only once
+        relations = []
+        resolved: Dict[str, Optional[EntityModel]] = {}
         for rel in markdown.relations:
             # Resolve the target permalink
-            target_entity = await self.link_resolver.resolve_link(
-                rel.target,
-            )
+            if rel.target not in resolved:
+                resolved[rel.target] = await self.link_resolver.resolve_link(rel.target)
+            target_entity = resolved[rel.target]
 
             # if the target is found, store the id
             target_id = target_entity.id if target_entity else None
             # if the target is found, store the title, otherwise add the target for a "forward link"
             target_name = target_entity.title if target_entity else rel.target
 
-            # Create the relation
-            relation = Relation(
-                from_id=db_entity.id,
-                to_id=target_id,
-                to_name=target_name,
-                relation_type=rel.type,
-                context=rel.context,
+            relations.append(
+                {
+                    "from_id": db_entity.id,
+                    "to_id": target_id,
+                    "to_name": target_name,
+                    "relation_type": rel.type,
+                    "context": rel.context,
+                }
+            )
+
+        # Insert all relations at once, duplicates in the file are skipped
+        added = await self.relation_repository.add_all_ignore_duplicates(relations)
+        if added < len(relations):
+            logger.debug(
+                f"Skipped {len(relations) - added} duplicate relations from {db_entity.permalink}"
             )
-            try:
-                await self.relation_repository.add(relation)
-            except IntegrityError:
-                # Unique constraint violation - relation already exists
-                logger.debug(
-                    f"Skipping duplicate relation {rel.type} from {db_entity.permalink} target: {rel.target}, type: {rel.type}"
-                )
-                continue
 
         return await self.repository.get_by_file_path(path)
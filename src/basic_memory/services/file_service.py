@@ -1,9 +1,11 @@
 """Service for file operations with checksum tracking."""
 
+import asyncio
 import mimetypes
+import time
 from os import stat_result
 from pathlib import Path
-from typing import Any, Dict, Tuple, Union
+from typing import Any, Dict, Optional, Tuple, Union
 
 from basic_memory import file_utils
 from basic_memory.file_utils import FileError
@@ -14,6 +16,10 @@ from basic_memory.services.exceptions import FileOperationError
 from basic_memory.utils import FilePath
 from loguru import logger
 
+# Files modified this recently are not added to the checksum cache. Their mtime may not
+# change on a further write within the filesystem's timestamp granularity.
+CHECKSUM_CACHE_MIN_AGE_NS = 2_000_000_000
+
 
 class FileService:
     """Service for handling file operations.
@@ -36,6 +42,8 @@ class FileService:
     ):
         self.base_path = base_path.resolve()  # Get absolute path
         self.markdown_processor = markdown_processor
+        # full path -> (st_mtime_ns, st_size, checksum), to skip rehashing unchanged files
+        self.checksum_cache: Dict[str, Tuple[int, int, str]] = {}
 
     def get_entity_path(self, entity: Union[EntityModel, EntitySchema]) -> Path:
         """Generate absolute filesystem path for entity.
@@ -198,6 +206,7 @@ class FileService:
         path_obj = Path(path) if isinstance(path, str) else path
         full_path = path_obj if path_obj.is_absolute() else self.base_path / path_obj
         full_path.unlink(missing_ok=True)
+        self.forget_checksum(full_path)
 
     async def update_frontmatter(self, path: FilePath, updates: Dict[str, Any]) -> str:
         """
@@ -218,6 +227,9 @@ class FileService:
     async def compute_checksum(self, path: FilePath) -> str:
         """Compute checksum for a file.
 
+        The file is hashed in a worker thread. Checksums are cached by file modification
+        time and size, so a file that has not changed since it was last hashed is not read.
+
         Args:
             path: Path to the file (Path or string)
 
@@ -232,18 +244,62 @@ class FileService:
         full_path = path_obj if path_obj.is_absolute() else self.base_path / path_obj
 
         try:
-            if self.is_markdown(path):
-                # read str
-                content = full_path.read_text(encoding="utf-8")
-            else:
-                # read bytes
-                content = full_path.read_bytes()
-            return await file_utils.compute_checksum(content)
+            stat = full_path.stat()
+            cache_key = str(full_path)
+            cached = self.checksum_cache.get(cache_key)
+            if cached and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+                return cached[2]
+
+            # markdown is hashed as text, binary files as raw bytes
+            checksum = await asyncio.to_thread(
+                file_utils.compute_file_checksum, full_path, self.is_markdown(path)
+            )
+
+            self.cache_checksum(full_path, stat.st_mtime_ns, stat.st_size, checksum)
+            return checksum
 
         except Exception as e:  # pragma: no cover
             logger.error("Failed to compute checksum", path=str(full_path), error=str(e))
             raise FileError(f"Failed to compute checksum for {path}: {e}")
 
+    def cache_checksum(self, path: FilePath, mtime_ns: int, size: int, checksum: str) -> None:
+        """Record a known checksum for a file at the given modification time and size.
+
+        Used to seed the cache with checksums stored in the database, so unchanged
+        files are not hashed again after a restart, and by callers that hashed content
+        they read themselves. The stat must be taken before the content was read.
+        Files modified within the last CHECKSUM_CACHE_MIN_AGE_NS are not cached.
+        """
+        if time.time_ns() - mtime_ns <= CHECKSUM_CACHE_MIN_AGE_NS:
+            return
+        path_obj = Path(path) if isinstance(path, str) else path
+        full_path = path_obj if path_obj.is_absolute() else self.base_path / path_obj
+        self.checksum_cache[str(full_path)] = (mtime_ns, size, checksum)
+
+    def cached_file_stat(
+        self, path: FilePath, checksum: str
+    ) -> Tuple[Optional[int], Optional[int]]:
+        """Get the (mtime_ns, size) the cached checksum for a file was computed at.
+
+        Returns (None, None) if the file has no cache entry for this checksum, e.g.
+        because it was modified too recently to be cached.
+        """
+        path_obj = Path(path) if isinstance(path, str) else path
+        full_path = path_obj if path_obj.is_absolute() else self.base_path / path_obj
+        cached = self.checksum_cache.get(str(full_path))
+        if cached is None or cached[2] != checksum:
+            return None, None
+        return cached[0], cached[1]
+
+    def forget_checksum(self, path: FilePath) -> None:
+        """Drop the cached checksum of a file that was deleted or moved away.
+
+        Keeps the cache from growing with entries for paths that no longer exist.
+        """
+        path_obj = Path(path) if isinstance(path, str) else path
+        full_path = path_obj if path_obj.is_absolute() else self.base_path / path_obj
+        self.checksum_cache.pop(str(full_path), None)
+
     def file_stats(self, path: FilePath) -> stat_result:
         """Return file stats for a given path.
 
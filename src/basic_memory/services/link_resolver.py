@@ -55,16 +55,15 @@ class LinkResolver:
         # search if indicated
         if use_search and "*" not in clean_text:
             # 3. Fall back to search for fuzzy matching on title
+            # results are ranked by bm25 in sqlite, so only the best match is needed
             results = await self.search_service.search(
                 query=SearchQuery(title=clean_text, entity_types=[SearchItemType.ENTITY]),
+                limit=1,
             )
 
             if results:
-                # Look for best match
-                best_match = min(results, key=lambda x: x.score)  # pyright: ignore
-                logger.debug(
-                    f"Selected best match from {len(results)} results: {best_match.permalink}"
-                )
+                best_match = results[0]
+                logger.debug(f"Selected best match: {best_match.permalink}")
                 if best_match.permalink:
                     return await self.entity_repository.get_by_permalink(best_match.permalink)
 
@@ -1,7 +1,8 @@
 """Service for search operations."""
 
+import asyncio
 from datetime import datetime
-from typing import List, Optional, Set
+from typing import List, Optional, Sequence, Set, Tuple
 
 from dateparser import parse
 from fastapi import BackgroundTasks
@@ -46,11 +47,10 @@ class SearchService:
         await self.repository.execute_query(text("DROP TABLE IF EXISTS search_index"), params={})
         await self.init_search_index()
 
-        # Reindex all entities
+        # Reindex all entities, one streamed batch at a time
         logger.debug("Indexing entities")
-        entities = await self.entity_repository.find_all()
-        for entity in entities:
-            await self.index_entity(entity, background_tasks)
+        async for entities in self.entity_repository.stream_all():
+            await self.index_entities(entities, background_tasks)
 
         logger.info("Reindex complete")
 
@@ -131,39 +131,63 @@ class SearchService:
         self,
         entity: Entity,
     ) -> None:
-        # delete all search index data associated with entity
-        await self.repository.delete_by_entity_id(entity_id=entity.id)
+        # replace all search index data associated with entity in one transaction
+        rows = await self.build_index_rows(entity)
+        await self.repository.bulk_index_items(rows, entity_ids=[entity.id])
 
-        # reindex
-        await self.index_entity_markdown(
-            entity
-        ) if entity.is_markdown else await self.index_entity_file(entity)
+    async def index_entities(
+        self,
+        entities: Sequence[Entity],
+        background_tasks: Optional[BackgroundTasks] = None,
+    ) -> None:
+        """Index multiple entities, writing all of their rows in one batch."""
+        if background_tasks:
+            background_tasks.add_task(self.index_entities_data, entities)
+        else:
+            await self.index_entities_data(entities)
 
-    async def index_entity_file(
+    async def index_entities_data(
         self,
-        entity: Entity,
+        entities: Sequence[Entity],
     ) -> None:
+        if not entities:
+            return
+
+        # replace all search index data associated with the entities in one transaction
+        rows = []
+        for entity in entities:
+            rows.extend(await self.build_index_rows(entity))
+        await self.repository.bulk_index_items(rows, entity_ids=[entity.id for entity in entities])
+
+    async def build_index_rows(self, entity: Entity) -> List[SearchIndexRow]:
+        """Build the search index rows for an entity."""
+        if entity.is_markdown:
+            return await self.build_markdown_index_rows(entity)
+        return [self.build_file_index_row(entity)]
+
+    def build_file_index_row(
+        self,
+        entity: Entity,
+    ) -> SearchIndexRow:
         # Index entity file with no content
-        await self.repository.index_item(
-            SearchIndexRow(
-                id=entity.id,
-                entity_id=entity.id,
-                type=SearchItemType.ENTITY.value,
-                title=entity.title,
-                file_path=entity.file_path,
-                metadata={
-                    "entity_type": entity.entity_type,
-                },
-                created_at=entity.created_at,
-                updated_at=entity.updated_at,
-            )
+        return SearchIndexRow(
+            id=entity.id,
+            entity_id=entity.id,
+            type=SearchItemType.ENTITY.value,
+            title=entity.title,
+            file_path=entity.file_path,
+            metadata={
+                "entity_type": entity.entity_type,
+            },
+            created_at=entity.created_at,
+            updated_at=entity.updated_at,
         )
 
-    async def index_entity_markdown(
+    async def build_markdown_index_rows(
         self,
         entity: Entity,
-    ) -> None:
-        """Index an entity and all its observations and relations.
+    ) -> List[SearchIndexRow]:
+        """Build index rows for an entity and all its observations and relations.
 
         Indexing structure:
         1. Entities
@@ -181,7 +205,7 @@ class SearchService:
         Each type gets its own row in the search index with appropriate metadata.
         """
 
-        if entity.permalink is None:  # pragma: no cover
+        if entity.permalink is None:
             logger.error(
                 "Missing permalink for markdown entity",
                 entity_id=entity.id,
@@ -207,19 +231,8 @@ class SearchService:
 
         entity_content_stems = "\n".join(p for p in content_stems if p and p.strip())
 
-        if entity.permalink is None:  # pragma: no cover
-            logger.error(
-                "Missing permalink for markdown entity",
-                entity_id=entity.id,
-                title=entity.title,
-                file_path=entity.file_path,
-            )
-            raise ValueError(
-                f"Entity permalink should not be None for markdown entity: {entity.id} ({entity.title})"
-            )
-
         # Index entity
-        await self.repository.index_item(
+        rows = [
             SearchIndexRow(
                 id=entity.id,
                 type=SearchItemType.ENTITY.value,
@@ -235,7 +248,7 @@ class SearchService:
                 created_at=entity.created_at,
                 updated_at=entity.updated_at,
             )
-        )
+        ]
 
         # Index each observation with permalink
         for obs in entity.observations:
@@ -243,7 +256,7 @@ class SearchService:
             obs_content_stems = "\n".join(
                 p for p in self._generate_variants(obs.content) if p and p.strip()
             )
-            await self.repository.index_item(
+            rows.append(
                 SearchIndexRow(
                     id=obs.id,
                     type=SearchItemType.OBSERVATION.value,
@@ -274,7 +287,7 @@ class SearchService:
             rel_content_stems = "\n".join(
                 p for p in self._generate_variants(relation_title) if p and p.strip()
             )
-            await self.repository.index_item(
+            rows.append(
                 SearchIndexRow(
                     id=rel.id,
                     title=relation_title,
@@ -291,6 +304,8 @@ class SearchService:
                 )
             )
 
+        return rows
+
     async def delete_by_permalink(self, permalink: str):
         """Delete an item from the search index."""
         await self.repository.delete_by_permalink(permalink)
@@ -298,3 +313,130 @@ class SearchService:
     async def delete_by_entity_id(self, entity_id: int):
         """Delete an item from the search index."""
         await self.repository.delete_by_entity_id(entity_id)
+
+    async def delete_entities(self, entities: Sequence[Entity]):
+        """Remove entities and everything indexed under them from the search index.
+
+        Rows owned by the entities (the entity, its observations and its outgoing
+        relations) are removed with one DELETE by entity id. Incoming relations are
+        indexed under their source entity, so they are removed by permalink.
+        """
+        if not entities:
+            return
+
+        await self.repository.delete_by_entity_ids([entity.id for entity in entities])
+        await self.repository.delete_by_permalinks(
+            [rel.permalink for entity in entities for rel in entity.incoming_relations]
+        )
+
+
+class AutoBatchIndexer:
+    """Coalesces index requests into batched writes to the search index.
+
+    Entities passed to enqueue() are collected by a background consumer task. The consumer
+    keeps collecting until max_batch_size entities are pending or no new entity arrives
+    within debounce_duration seconds, then indexes the batch with a single bulk write.
+    With no debounce it only takes the entities already queued. Repeated requests for the
+    same entity within a batch are indexed once.
+
+    Each enqueue() returns a future for that entity, so a caller only sees the errors of
+    the entities it queued. If a batch write fails, its entities are indexed one at a
+    time so one bad entity does not fail the rest.
+    """
+
+    def __init__(
+        self,
+        search_service: SearchService,
+        max_batch_size: int = 200,
+        debounce_duration: float = 0.05,
+    ):
+        self.search_service = search_service
+        self.max_batch_size = max_batch_size
+        self.debounce_duration = debounce_duration
+        self.queue: asyncio.Queue[Tuple[Entity, asyncio.Future[None]]] = asyncio.Queue()
+        self.consumer: Optional[asyncio.Task] = None
+
+    def enqueue(self, entity: Entity) -> asyncio.Future[None]:
+        """Queue an entity to be indexed with the next batch.
+
+        Returns:
+            Future that completes once the entity is indexed, or raises the error that
+            prevented it from being indexed
+        """
+        future = asyncio.get_running_loop().create_future()
+        self.queue.put_nowait((entity, future))
+        if self.consumer is None or self.consumer.done():
+            self.consumer = asyncio.create_task(self.consume())
+        return future
+
+    async def flush(self) -> None:
+        """Wait until all queued entities have been processed.
+
+        Failures are not raised here but through the futures returned by enqueue().
+        """
+        await self.queue.join()
+
+    async def consume(self) -> None:
+        """Index queued entities in batches until the queue is drained."""
+        while not self.queue.empty():
+            batch: dict[int, Entity] = {}
+            futures: dict[int, List[asyncio.Future[None]]] = {}
+            received = 0
+            try:
+                while len(batch) < self.max_batch_size:
+                    if not self.queue.empty():
+                        entity, future = self.queue.get_nowait()
+                    elif self.debounce_duration > 0:
+                        try:
+                            entity, future = await asyncio.wait_for(
+                                self.queue.get(), timeout=self.debounce_duration
+                            )
+                        except TimeoutError:
+                            break
+                    else:
+                        break
+                    received += 1
+                    # keep the most recent version of each entity
+                    batch[entity.id] = entity
+                    futures.setdefault(entity.id, []).append(future)
+
+                if batch:
+                    logger.debug(f"Indexing batch of {len(batch)} entities")
+                    await self.search_service.index_entities(list(batch.values()))
+                    for entity_futures in futures.values():
+                        self.complete(entity_futures)
+            except Exception as e:
+                logger.exception("Failed to index batch", batch_size=len(batch), error=str(e))
+                await self.index_one_at_a_time(list(batch.values()), futures)
+            finally:
+                # never leave a caller waiting, e.g. when the consumer is cancelled
+                for entity_futures in futures.values():
+                    self.complete(entity_futures, RuntimeError("Search indexing stopped"))
+                for _ in range(received):
+                    self.queue.task_done()
+
+    async def index_one_at_a_time(
+        self, entities: List[Entity], futures: dict[int, List[asyncio.Future[None]]]
+    ) -> None:
+        """Index entities individually, failing only the futures of entities that still fail."""
+        for entity in entities:
+            try:
+                await self.search_service.index_entity(entity)
+            except Exception as e:
+                logger.exception("Failed to index entity", entity_id=entity.id, error=str(e))
+                self.complete(futures[entity.id], e)
+            else:
+                self.complete(futures[entity.id])
+
+    @staticmethod
+    def complete(
+        futures: List[asyncio.Future[None]], error: Optional[BaseException] = None
+    ) -> None:
+        """Resolve the futures of one entity that are still pending."""
+        for future in futures:
+            if future.done():
+                continue
+            if error is None:
+                future.set_result(None)
+            else:
+                future.set_exception(error)
@@ -1,25 +1,32 @@
 """Service for syncing files between filesystem and database."""
 
+import asyncio
 import os
+from collections import deque
 
 from dataclasses import dataclass
 from dataclasses import field
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Optional, Set, Tuple
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
 
 from loguru import logger
 from sqlalchemy.exc import IntegrityError
 
-from basic_memory.markdown import EntityParser
+from basic_memory import file_utils
+from basic_memory.markdown import EntityMarkdown, EntityParser
 from basic_memory.models import Entity
 from basic_memory.repository import EntityRepository, RelationRepository
 from basic_memory.services import EntityService, FileService
-from basic_memory.services.search_service import SearchService
+from basic_memory.services.search_service import AutoBatchIndexer, SearchService
 import time
 from rich.progress import Progress, TextColumn, BarColumn, TaskProgressColumn
 
 
+# parsed markdown and the checksum of the text it was parsed from, (None, None) if not parsed
+ParsedFile = Tuple[Optional[EntityMarkdown], Optional[str]]
+
+
 @dataclass
 class SyncReport:
     """Report of file changes found compared to database state.
@@ -71,6 +78,11 @@ class SyncService:
         relation_repository: RelationRepository,
         search_service: SearchService,
         file_service: FileService,
+        index_batch_size: int = 200,
+        index_debounce_ms: int = 50,
+        parse_queue_size: int = 64,
+        parse_concurrency: int = 32,
+        scan_concurrency: int = os.cpu_count() or 4,
     ):
         self.entity_service = entity_service
         self.entity_parser = entity_parser
@@ -78,6 +90,33 @@ class SyncService:
         self.relation_repository = relation_repository
         self.search_service = search_service
         self.file_service = file_service
+        self.search_indexer = AutoBatchIndexer(
+            search_service,
+            max_batch_size=index_batch_size,
+            debounce_duration=index_debounce_ms / 1000,
+        )
+        # futures of entities queued for the search index since the last report
+        self.index_futures: List[asyncio.Future[None]] = []
+        self.parse_queue_size = parse_queue_size
+        self.parse_concurrency = parse_concurrency
+        self.scan_concurrency = scan_concurrency
+
+    def queue_search_index(self, entity: Entity) -> None:
+        """Queue an entity for a batched search index write."""
+        self.index_futures.append(self.search_indexer.enqueue(entity))
+
+    async def flush_search_index(self) -> None:
+        """Wait for queued search index writes and report every entity that failed.
+
+        Raises:
+            ExceptionGroup: the errors of all queued entities that could not be indexed
+        """
+        await self.search_indexer.flush()
+        futures, self.index_futures = self.index_futures, []
+        results = await asyncio.gather(*futures, return_exceptions=True)
+        errors = [result for result in results if isinstance(result, Exception)]
+        if errors:
+            raise ExceptionGroup(f"Failed to index {len(errors)} entities", errors)
 
     async def sync(self, directory: Path, show_progress: bool = True) -> SyncReport:
         """Sync all files with database."""
@@ -167,19 +206,17 @@ class SyncService:
                     progress.update(delete_task, advance=1)  # pyright: ignore
 
             # then new and modified
-            for i, path in enumerate(report.new):
-                await self.sync_file(path, new=True)
-                if new_task is not None:
-                    progress.update(new_task, advance=1)  # pyright: ignore
+            def advance(path: str, new: bool):
+                task = new_task if new else modify_task
+                if task is not None:
+                    progress.update(task, advance=1)  # pyright: ignore
 
-            for i, path in enumerate(report.modified):  # pragma: no cover
-                await self.sync_file(path, new=False)
-                if modify_task is not None:  # pragma: no cover
-                    progress.update(modify_task, advance=1)  # pyright: ignore
+            await self.sync_files(self.changed_files(report), on_synced=advance)
 
             # Final step - resolving relations
             if report.total > 0:
                 relation_task = progress.add_task("[cyan]Resolving relations...", total=1)  # pyright: ignore
+                await self.search_indexer.flush()
                 await self.resolve_relations()
                 progress.update(relation_task, advance=1)  # pyright: ignore
         else:
@@ -204,14 +241,15 @@ class SyncService:
                 await self.handle_delete(path)
 
             # then new and modified
-            for path in report.new:
-                await self.sync_file(path, new=True)
-
-            for path in report.modified:
-                await self.sync_file(path, new=False)
+            await self.sync_files(self.changed_files(report))
 
+            # make new entities searchable before resolving forward references
+            await self.search_indexer.flush()
             await self.resolve_relations()
 
+        # wait for any pending search index writes
+        await self.flush_search_index()
+
         duration_ms = int((time.time() - start_time) * 1000)
         logger.info(
             "Sync operation completed",
@@ -269,23 +307,143 @@ class SyncService:
 
     async def get_db_file_state(self) -> Dict[str, str]:
         """Get file_path and checksums from database.
-        Args:
-            db_records: database records
+
+        Checksums stored with the file's modification time and size are added to the
+        file service's checksum cache, so files unchanged since they were synced are
+        not hashed again.
+
         Returns:
-            Dict mapping file paths to FileState
-            :param db_records: the data from the db
+            Dict mapping file paths to checksums
         """
-        db_records = await self.entity_repository.find_all()
-        return {r.file_path: r.checksum or "" for r in db_records}
+        rows = await self.entity_repository.get_file_states()
+        for row in rows:
+            if row.checksum and row.mtime_ns is not None and row.size is not None:
+                self.file_service.cache_checksum(
+                    row.file_path, row.mtime_ns, row.size, row.checksum
+                )
+        return {row.file_path: row.checksum or "" for row in rows}
+
+    def changed_files(self, report: SyncReport) -> List[Tuple[str, bool]]:
+        """List new and modified files from a report as (path, is_new), new files first."""
+        return [(path, True) for path in report.new] + [(path, False) for path in report.modified]
+
+    async def parse_markdown_files(
+        self,
+        files: List[Tuple[str, bool]],
+        queue: "asyncio.Queue[Tuple[str, bool, ParsedFile]]",
+    ) -> None:
+        """Parse stage of the sync pipeline.
+
+        Reads and parses markdown files ahead of the database writes and hands them to
+        the write stage in order. Up to `parse_concurrency` files are parsed at once, and
+        the queue is bounded, so parsing never runs more than `parse_queue_size` files
+        ahead of the writes.
+        """
+        pending: deque[Tuple[str, bool, asyncio.Task[ParsedFile]]] = deque()
+        try:
+            for path, new in files:
+                pending.append((path, new, asyncio.create_task(self.parse_markdown_file(path))))
+                if len(pending) >= self.parse_concurrency:
+                    path, new, task = pending.popleft()
+                    await queue.put((path, new, await task))
+
+            while pending:
+                path, new, task = pending.popleft()
+                await queue.put((path, new, await task))
+        finally:
+            for _, _, task in pending:
+                task.cancel()
+
+    async def parse_markdown_file(self, path: str) -> ParsedFile:
+        """Parse a file for the sync pipeline.
+
+        Returns (None, None) for non-markdown files and for files that fail to parse, so
+        the write stage parses them itself and reports the error.
+        """
+        if not self.file_service.is_markdown(path):
+            return None, None
+        try:
+            return await self.parse_markdown_with_checksum(path)
+        except Exception as e:  # pragma: no cover
+            logger.debug("Deferring parse error to sync", path=path, error=str(e))
+            return None, None
+
+    async def parse_markdown_with_checksum(self, path: str) -> Tuple[EntityMarkdown, str]:
+        """Parse a markdown file and checksum the exact text that was parsed.
+
+        Hashing the parsed text rather than reading the file again means the checksum
+        always describes the stored content, even if the file is edited in between.
+        """
+        # stat before reading, so a later edit can't be cached under this checksum
+        stat = await asyncio.to_thread(self.file_service.file_stats, path)
+        entity_markdown, text = await self.entity_parser.parse_file_with_text(path)
+        checksum = await file_utils.compute_checksum(text)
+        self.file_service.cache_checksum(path, stat.st_mtime_ns, stat.st_size, checksum)
+        return entity_markdown, checksum
+
+    async def next_parsed_file(
+        self,
+        queue: "asyncio.Queue[Tuple[str, bool, ParsedFile]]",
+        parser: asyncio.Task,
+    ) -> Tuple[str, bool, ParsedFile]:
+        """Get the next parsed file, failing instead of waiting if the parse stage died."""
+        get = asyncio.ensure_future(queue.get())
+        await asyncio.wait({get, parser}, return_when=asyncio.FIRST_COMPLETED)
+        if not get.done() and (parser.cancelled() or parser.exception() is not None):
+            get.cancel()
+            raise RuntimeError("File parsing stopped before all files were synced") from (
+                None if parser.cancelled() else parser.exception()
+            )
+        # either an item arrived, or the parse stage finished after queueing every file
+        return await get
+
+    async def sync_files(
+        self,
+        files: List[Tuple[str, bool]],
+        on_synced: Optional[Callable[[str, bool], None]] = None,
+    ) -> None:
+        """Sync new and modified files as a parse -> write -> index pipeline.
+
+        Parsing (file I/O) runs in a background task while this coroutine writes
+        entities to the database in the original order. Search indexing is handed off
+        to the batching indexer, so all three stages overlap.
+
+        Args:
+            files: (path, is_new) pairs to sync
+            on_synced: Optional callback invoked after each file is written
+        """
+        queue: asyncio.Queue[Tuple[str, bool, ParsedFile]] = asyncio.Queue(
+            maxsize=self.parse_queue_size
+        )
+        parser = asyncio.create_task(self.parse_markdown_files(files, queue))
+        try:
+            for _ in range(len(files)):
+                path, new, (markdown, checksum) = await self.next_parsed_file(queue, parser)
+                await self.sync_file(path, new=new, markdown=markdown, checksum=checksum)
+                if on_synced is not None:
+                    on_synced(path, new)
+        finally:
+            parser.cancel()
+            try:
+                await parser
+            except (asyncio.CancelledError, Exception):
+                # a parse stage failure was already raised by next_parsed_file
+                pass
 
     async def sync_file(
-        self, path: str, new: bool = True
+        self,
+        path: str,
+        new: bool = True,
+        markdown: Optional[EntityMarkdown] = None,
+        checksum: Optional[str] = None,
     ) -> Tuple[Optional[Entity], Optional[str]]:
         """Sync a single file.
 
         Args:
             path: Path to file to sync
             new: Whether this is a new file
+            markdown: Already parsed content for a markdown file, if available
+            checksum: Checksum of the text `markdown` was parsed from
 
         Returns:
             Tuple of (entity, checksum) or (None, None) if sync fails
@@ -299,12 +457,12 @@ class SyncService:
             )
 
             if self.file_service.is_markdown(path):
-                entity, checksum = await self.sync_markdown_file(path, new)
+                entity, checksum = await self.sync_markdown_file(path, new, markdown, checksum)
             else:
                 entity, checksum = await self.sync_regular_file(path, new)
 
             if entity is not None:
-                await self.search_service.index_entity(entity)
+                self.queue_search_index(entity)
 
                 logger.debug(
                     "File sync completed", path=path, entity_id=entity.id, checksum=checksum
@@ -315,23 +473,41 @@ class SyncService:
             logger.exception("Failed to sync file", path=path, error=str(e))
             return None, None
 
-    async def sync_markdown_file(self, path: str, new: bool = True) -> Tuple[Optional[Entity], str]:
+    async def sync_markdown_file(
+        self,
+        path: str,
+        new: bool = True,
+        entity_markdown: Optional[EntityMarkdown] = None,
+        checksum: Optional[str] = None,
+    ) -> Tuple[Optional[Entity], str]:
         """Sync a markdown file with full processing.
 
         Args:
             path: Path to markdown file
             new: Whether this is a new file
+            entity_markdown: Already parsed content, parsed from disk if not given
+            checksum: Checksum of the text `entity_markdown` was parsed from
 
         Returns:
             Tuple of (entity, checksum)
         """
         # Parse markdown first to get any existing permalink
-        logger.debug("Parsing markdown file", path=path)
-        entity_markdown = await self.entity_parser.parse_file(path)
+        if entity_markdown is None or checksum is None:
+            logger.debug("Parsing markdown file", path=path)
+            entity_markdown, checksum = await self.parse_markdown_with_checksum(path)
 
         # Resolve permalink - this handles all the cases including conflicts
         permalink = await self.entity_service.resolve_permalink(path, markdown=entity_markdown)
 
+        # The permalink update rewrites the file from what is on disk now, so if the file
+        # changed since it was parsed ahead, parse it again first
+        if permalink != entity_markdown.frontmatter.permalink and (
+            await self.file_service.compute_checksum(path) != checksum
+        ):
+            logger.debug("File changed since it was parsed, parsing again", path=path)
+            entity_markdown, checksum = await self.parse_markdown_with_checksum(path)
+            permalink = await self.entity_service.resolve_permalink(path, markdown=entity_markdown)
+
         # If permalink changed, update the file
         if permalink != entity_markdown.frontmatter.permalink:
             logger.info(
@@ -343,8 +519,6 @@ class SyncService:
 
             entity_markdown.frontmatter.metadata["permalink"] = permalink
             checksum = await self.file_service.update_frontmatter(path, {"permalink": permalink})
-        else:
-            checksum = await self.file_service.compute_checksum(path)
 
         # if the file is new, create an entity
         if new:
@@ -363,7 +537,7 @@ class SyncService:
         entity = await self.entity_service.update_entity_relations(path, entity_markdown)
 
         # set checksum
-        await self.entity_repository.update(entity.id, {"checksum": checksum})
+        await self.entity_repository.update(entity.id, self.checksum_values(path, checksum))
 
         logger.debug(
             "Markdown sync completed",
@@ -403,7 +577,7 @@ class SyncService:
                 Entity(
                     entity_type="file",
                     file_path=path,
-                    checksum=checksum,
+                    **self.checksum_values(path, checksum),
                     title=file_path.name,
                     created_at=created,
                     updated_at=modified,
@@ -418,7 +592,7 @@ class SyncService:
                 raise ValueError(f"Entity not found for existing file: {path}")
 
             updated = await self.entity_repository.update(
-                entity.id, {"file_path": path, "checksum": checksum}
+                entity.id, {"file_path": path, **self.checksum_values(path, checksum)}
             )
 
             if updated is None:  # pragma: no cover
@@ -427,8 +601,17 @@ class SyncService:
 
             return updated, checksum
 
+    def checksum_values(self, path: str, checksum: str) -> Dict[str, Any]:
+        """Entity values recording a file's checksum and the file stat it was computed at."""
+        mtime_ns, size = self.file_service.cached_file_stat(path, checksum)
+        return {"checksum": checksum, "mtime_ns": mtime_ns, "size": size}
+
     async def handle_delete(self, file_path: str):
         """Handle complete entity deletion including search index cleanup."""
+        self.file_service.forget_checksum(file_path)
+
+        # Make sure a pending index write can't re-add the entity after deletion
+        await self.search_indexer.flush()
 
         # First get entity to get permalink before deletion
         entity = await self.entity_repository.get_by_file_path(file_path)
@@ -444,27 +627,16 @@ class SyncService:
             await self.entity_service.delete_entity_by_file_path(file_path)
 
             # Clean up search index
-            permalinks = (
-                [entity.permalink]
-                + [o.permalink for o in entity.observations]
-                + [r.permalink for r in entity.relations]
-            )
-
             logger.debug(
                 "Cleaning up search index",
                 entity_id=entity.id,
                 file_path=file_path,
-                index_entries=len(permalinks),
             )
-
-            for permalink in permalinks:
-                if permalink:
-                    await self.search_service.delete_by_permalink(permalink)
-                else:
-                    await self.search_service.delete_by_entity_id(entity.id)
+            await self.search_service.delete_entities([entity])
 
     async def handle_move(self, old_path, new_path):
         logger.info("Moving entity", old_path=old_path, new_path=new_path)
+        self.file_service.forget_checksum(old_path)
 
         entity = await self.entity_repository.get_by_file_path(old_path)
         if entity:
@@ -489,7 +661,7 @@ class SyncService:
             )
 
             # update search index
-            await self.search_service.index_entity(updated)
+            self.queue_search_index(updated)
 
     async def resolve_relations(self):
         """Try to resolve any unresolved relations"""
@@ -498,6 +670,12 @@ class SyncService:
 
         logger.info("Resolving forward references", count=len(unresolved_relations))
 
+        # entities whose relations changed and need to be reindexed
+        changed_entity_ids: Set[int] = set()
+
+        # many relations usually point at the same missing target, resolve each name once
+        resolved: Dict[str, Optional[Entity]] = {}
+
         for relation in unresolved_relations:
             logger.debug(
                 "Attempting to resolve relation",
@@ -506,7 +684,11 @@ class SyncService:
                 to_name=relation.to_name,
             )
 
-            resolved_entity = await self.entity_service.link_resolver.resolve_link(relation.to_name)
+            if relation.to_name not in resolved:
+                resolved[relation.to_name] = await self.entity_service.link_resolver.resolve_link(
+                    relation.to_name
+                )
+            resolved_entity = resolved[relation.to_name]
 
             # ignore reference to self
             if resolved_entity and resolved_entity.id != relation.from_id:
@@ -526,6 +708,7 @@ class SyncService:
                             "to_name": resolved_entity.title,
                         },
                     )
+                    changed_entity_ids.add(relation.from_id)
                 except IntegrityError:  # pragma: no cover
                     logger.debug(
                         "Ignoring duplicate relation",
@@ -534,13 +717,18 @@ class SyncService:
                         to_name=relation.to_name,
                     )
 
-                # update search index
-                await self.search_service.index_entity(resolved_entity)
+        # Relations are indexed under their source entity, so reindex only the sources
+        # of relations that were actually resolved, once each
+        if changed_entity_ids:
+            for entity in await self.entity_repository.find_by_ids(list(changed_entity_ids)):
+                self.queue_search_index(entity)
 
     async def scan_directory(self, directory: Path) -> ScanResult:
         """
         Scan directory for markdown files and their checksums.
 
+        Files are hashed in worker threads, up to `scan_concurrency` at once.
+
         Args:
             directory: Directory to scan
 
@@ -552,22 +740,26 @@ class SyncService:
         logger.debug("Scanning directory", directory=str(directory))
         result = ScanResult()
 
-        for root, dirnames, filenames in os.walk(str(directory)):
-            # Skip dot directories in-place
-            dirnames[:] = [d for d in dirnames if not d.startswith(".")]
-
-            for filename in filenames:
-                # Skip dot files
-                if filename.startswith("."):
-                    continue
+        def add_result(rel_path: str, checksum: str) -> None:
+            result.files[rel_path] = checksum
+            result.checksums[checksum] = rel_path
+            logger.debug("Found file", path=rel_path, checksum=checksum)
 
-                path = Path(root) / filename
-                rel_path = str(path.relative_to(directory))
-                checksum = await self.file_service.compute_checksum(rel_path)
-                result.files[rel_path] = checksum
-                result.checksums[checksum] = rel_path
-
-                logger.debug("Found file", path=rel_path, checksum=checksum)
+        pending: deque[Tuple[str, asyncio.Task[str]]] = deque()
+        try:
+            for rel_path in self.walk_files(directory):
+                task = asyncio.create_task(self.file_service.compute_checksum(rel_path))
+                pending.append((rel_path, task))
+                if len(pending) >= self.scan_concurrency:
+                    rel_path, task = pending.popleft()
+                    add_result(rel_path, await task)
+
+            while pending:
+                rel_path, task = pending.popleft()
+                add_result(rel_path, await task)
+        finally:
+            for _, task in pending:
+                task.cancel()
 
         duration_ms = int((time.time() - start_time) * 1000)
         logger.debug(
@@ -578,3 +770,25 @@ class SyncService:
         )
 
         return result
+
+    def walk_files(self, directory: Path) -> Iterator[str]:
+        """Yield paths relative to `directory` of all files in it, skipping dot files and dirs.
+
+        Uses os.scandir, whose entries carry the file type from the directory listing, so
+        no extra stat call is made per file. Symlinked directories are not followed.
+        """
+        stack = [str(directory)]
+        while stack:
+            current = stack.pop()
+            try:
+                with os.scandir(current) as entries:
+                    for entry in entries:
+                        if entry.name.startswith("."):
+                            continue
+                        if entry.is_dir():
+                            if not entry.is_symlink():
+                                stack.append(entry.path)
+                        else:
+                            yield os.path.relpath(entry.path, directory)
+            except OSError as e:  # pragma: no cover
+                logger.warning("Failed to scan directory", directory=current, error=str(e))
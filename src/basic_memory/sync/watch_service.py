@@ -325,6 +325,9 @@ class WatchService:
                 )
                 processed.add(path)
 
+        # Wait for the search index to catch up with this batch of changes
+        await self.sync_service.flush_search_index()
+
         # Add a concise summary instead of a divider
         if processed:
             changes = []  # pyright: ignore
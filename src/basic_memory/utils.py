@@ -6,7 +6,7 @@ import logging
 import re
 import sys
 from pathlib import Path
-from typing import Optional, Protocol, Union, runtime_checkable, List
+from typing import Iterator, Optional, Protocol, Sequence, Union, runtime_checkable, List
 
 from loguru import logger
 from unidecode import unidecode
@@ -154,3 +154,12 @@ def parse_tags(tags: Union[List[str], str, None]) -> List[str]:
     except (ValueError, TypeError):  # pragma: no cover
         logger.warning(f"Couldn't parse tags from input of type {type(tags)}: {tags}")
         return []
+
+
+def chunked[T](items: Sequence[T], size: int) -> Iterator[Sequence[T]]:
+    """Split a sequence into consecutive chunks of at most `size` items.
+
+    Used to keep `IN (...)` queries under SQLite's bound parameter limit.
+    """
+    for i in range(0, len(items), size):
+        yield items[i : i + size]
@@ -40,6 +40,25 @@ async def test_create_entity(client: AsyncClient, file_service):
     assert data["content"] in file_content
 
 
+@pytest.mark.asyncio
+async def test_create_entity_unicode_response(client: AsyncClient):
+    """Responses are compact UTF-8 JSON, matching the stdlib encoding."""
+    data = {
+        "title": "Café Notes",
+        "folder": "test",
+        "entity_type": "test",
+        "content": "Ünïcode content ✓",
+    }
+    response = await client.post("/knowledge/entities", json=data)
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    assert "Café Notes".encode() in response.content
+    assert b'", "' not in response.content
+
+    entity = EntityResponse.model_validate(response.json())
+    assert entity.title == "Café Notes"
+
+
 @pytest.mark.asyncio
 async def test_create_entity_observations_relations(client: AsyncClient, file_service):
     """Should create entity successfully."""
@@ -480,3 +499,47 @@ async def test_update_entity_search_index(client: AsyncClient):
     results = search_response.json()["results"]
     assert len(results) == 1
     assert results[0]["permalink"] == entity.permalink
+
+
+@pytest.mark.asyncio
+async def test_create_entity_with_search_indexer(client: AsyncClient, app):
+    """Entities written through the API are indexed by the app's indexer before the response."""
+    search_indexer = app.state.search_indexer
+    data = {
+        "title": "Indexed Batch",
+        "folder": "test",
+        "entity_type": "test",
+        "content": "Content for the batch indexer",
+    }
+    response = await client.post("/knowledge/entities", json=data)
+    assert response.status_code == 200
+    assert search_indexer.queue.empty()
+
+    response = await client.post("/search/", json={"permalink": "test/indexed-batch"})
+    assert len(response.json()["results"]) == 1
+
+    response = await client.delete("/knowledge/entities/test/indexed-batch")
+    assert response.json()["deleted"] is True
+    response = await client.post("/search/", json={"permalink": "test/indexed-batch"})
+    assert len(response.json()["results"]) == 0
+
+
+@pytest.mark.asyncio
+async def test_create_entity_without_app_search_indexer(client: AsyncClient, app):
+    """Without an indexer from the app lifespan, each request indexes its own entity."""
+    search_indexer = app.state.search_indexer
+    del app.state.search_indexer
+    try:
+        data = {
+            "title": "Indexed Alone",
+            "folder": "test",
+            "entity_type": "test",
+            "content": "Content indexed by the request",
+        }
+        response = await client.post("/knowledge/entities", json=data)
+        assert response.status_code == 200
+
+        response = await client.post("/search/", json={"permalink": "test/indexed-alone"})
+        assert len(response.json()["results"]) == 1
+    finally:
+        app.state.search_indexer = search_indexer
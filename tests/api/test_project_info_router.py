@@ -75,6 +75,12 @@ async def test_get_project_info_content(test_graph, client, test_config):
     # Check that entity types include 'test'
     assert "test" in stats["entity_types"] or "entity" in stats["entity_types"]
 
+    # Totals agree with the grouped counts
+    assert stats["total_entities"] == sum(stats["entity_types"].values())
+    assert stats["total_observations"] == sum(stats["observation_categories"].values())
+    assert stats["total_relations"] == sum(stats["relation_types"].values())
+    assert 0 <= stats["total_unresolved_relations"] <= stats["total_relations"]
+
 
 @pytest.mark.asyncio
 async def test_get_project_info_watch_status(test_graph, client, test_config):
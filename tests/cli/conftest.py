@@ -7,15 +7,21 @@ from httpx import AsyncClient, ASGITransport
 
 from basic_memory.api.app import app as fastapi_app
 from basic_memory.deps import get_project_config, get_engine_factory
+from basic_memory.services.search_service import AutoBatchIndexer
 
 
 @pytest_asyncio.fixture
-def app(test_config, engine_factory) -> FastAPI:
+async def app(test_config, engine_factory, search_service) -> AsyncGenerator[FastAPI, None]:
     """Create test FastAPI application."""
     app = fastapi_app
     app.dependency_overrides[get_project_config] = lambda: test_config
     app.dependency_overrides[get_engine_factory] = lambda: engine_factory
-    return app
+    # stands in for the indexer the app lifespan creates, scoped to this test's database
+    app.state.search_indexer = AutoBatchIndexer(search_service, debounce_duration=0)
+    yield app
+
+    await app.state.search_indexer.flush()
+    del app.state.search_indexer
 
 
 @pytest_asyncio.fixture
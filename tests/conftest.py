@@ -54,9 +54,14 @@ def test_config(tmp_path) -> ProjectConfig:
 async def engine_factory(
     test_config,
 ) -> AsyncGenerator[tuple[AsyncEngine, async_sessionmaker[AsyncSession]], None]:
-    """Create engine and session factory using in-memory SQLite database."""
+    """Create engine and session factory using a SQLite database file in the test's tmp_path.
+
+    A file database gives every session its own connection, as in production. An in-memory
+    database lives on one shared connection, so concurrent sessions, such as a background
+    search index write, would commit or roll back each other's transactions.
+    """
     async with db.engine_session_factory(
-        db_path=test_config.database_path, db_type=DatabaseType.MEMORY
+        db_path=test_config.database_path, db_type=DatabaseType.FILESYSTEM
     ) as (engine, session_maker):
         # Create all tables for the DB the engine is connected to
         async with engine.begin() as conn:
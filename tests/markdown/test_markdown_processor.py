@@ -145,8 +145,8 @@ async def test_update_preserves_content(markdown_processor: MarkdownProcessor, t
 
     # Both observations present
     assert len(result.observations) == 2
-    assert any(o.content == "First observation" for o in result.observations)
-    assert any(o.content == "Second observation" for o in result.observations)
+    contents = {o.content for o in result.observations}
+    assert contents == {"First observation", "Second observation"}
 
 
 @pytest.mark.asyncio
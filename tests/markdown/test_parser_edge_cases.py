@@ -44,13 +44,15 @@ async def test_unicode_content(tmp_path):
     assert "🧪" in entity.content
 
     # Verify Unicode in observations
-    assert any(o.content == "Emoji test 👍 #emoji #test" for o in entity.observations)
-    assert any(o.category == "中文" for o in entity.observations)
-    assert any(o.category == "русский" for o in entity.observations)
+    assert "Emoji test 👍 #emoji #test" in {o.content for o in entity.observations}
+    categories = {o.category for o in entity.observations}
+    assert "中文" in categories
+    assert "русский" in categories
 
     # Verify Unicode in relations
-    assert any(r.target == "测试组件" for r in entity.relations)
-    assert any(r.target == "компонент" for r in entity.relations)
+    targets = {r.target for r in entity.relations}
+    assert "测试组件" in targets
+    assert "компонент" in targets
 
 
 @pytest.mark.asyncio
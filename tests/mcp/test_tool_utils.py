@@ -1,12 +1,14 @@
 """Tests for MCP tool utilities."""
 
+from datetime import datetime
 from unittest.mock import AsyncMock
 
 import pytest
 from httpx import AsyncClient, HTTPStatusError
 from mcp.server.fastmcp.exceptions import ToolError
 
-from basic_memory.mcp.tools.utils import call_get, call_post, call_put, call_delete
+from basic_memory.mcp.tools.utils import call_get, call_post, call_put, call_put_json, call_delete
+from basic_memory.schemas.search import SearchQuery
 
 
 @pytest.fixture
@@ -168,3 +170,19 @@ async def test_call_post_with_json(mock_response):
     mock_post.assert_called_once()
     call_kwargs = mock_post.call_args[1]
     assert call_kwargs["json"] == json_data
+
+
+@pytest.mark.asyncio
+async def test_call_put_json(mock_response):
+    """Test PUT request with a model serialized straight to JSON."""
+    client = AsyncClient()
+    client.put = AsyncMock(return_value=mock_response())
+
+    query = SearchQuery(text="test", after_date=datetime(2025, 1, 1))
+    response = await call_put_json(client, "http://test.com", query)
+    assert response.status_code == 200
+
+    kwargs = client.put.call_args.kwargs
+    assert kwargs["headers"] == {"content-type": "application/json"}
+    assert SearchQuery.model_validate_json(kwargs["content"]) == query
+    assert kwargs["json"] is None
@@ -311,6 +311,37 @@ async def test_find_by_permalinks(entity_repository: EntityRepository, test_enti
     assert len(found) == 0
 
 
+@pytest.mark.asyncio
+async def test_find_by_permalinks_many(entity_repository: EntityRepository):
+    """Test lookups and deletes with more values than fit in one IN clause."""
+    now = datetime.now(timezone.utc)
+    entities = await entity_repository.create_all(
+        [
+            {
+                "title": f"Entity {i}",
+                "entity_type": "test",
+                "permalink": f"bulk/entity-{i}",
+                "file_path": f"bulk/entity-{i}.md",
+                "content_type": "text/markdown",
+                "created_at": now,
+                "updated_at": now,
+            }
+            for i in range(1200)
+        ]
+    )
+    assert len(entities) == 1200
+
+    found = await entity_repository.find_by_permalinks([e.permalink for e in entities])
+    assert len(found) == 1200
+
+    found = await entity_repository.find_by_ids([e.id for e in entities])
+    assert len(found) == 1200
+
+    deleted = await entity_repository.delete_by_ids([e.id for e in entities])
+    assert deleted == 1200
+    assert await entity_repository.count() == 0
+
+
 @pytest.mark.asyncio
 async def test_generate_permalink_from_file_path():
     """Test permalink generation from different file paths."""
@@ -420,3 +451,37 @@ async def test_get_by_file_path(entity_repository: EntityRepository, session_mak
     # Test non-existent file_path
     found = await entity_repository.get_by_file_path("not/a/real/file.md")
     assert found is None
+
+
+@pytest.mark.asyncio
+async def test_stream_all(entity_repository: EntityRepository):
+    """Test streaming all entities in batches."""
+    now = datetime.now(timezone.utc)
+    await entity_repository.create_all(
+        [
+            {
+                "title": f"Entity {i}",
+                "entity_type": "test",
+                "permalink": f"stream/entity-{i}",
+                "file_path": f"stream/entity-{i}.md",
+                "content_type": "text/markdown",
+                "checksum": f"checksum-{i}" if i % 2 else None,
+                "created_at": now,
+                "updated_at": now,
+            }
+            for i in range(25)
+        ]
+    )
+
+    batches = [batch async for batch in entity_repository.stream_all(batch_size=10)]
+    assert [len(batch) for batch in batches] == [10, 10, 5]
+    assert [e.permalink for batch in batches for e in batch] == [
+        f"stream/entity-{i}" for i in range(25)
+    ]
+    # eager loaded collections are available after the stream is closed
+    assert batches[0][0].observations == []
+
+    states = {row.file_path: row for row in await entity_repository.get_file_states()}
+    assert len(states) == 25
+    assert states["stream/entity-0.md"].checksum is None
+    assert states["stream/entity-1.md"].checksum == "checksum-1"
@@ -84,6 +84,33 @@ async def test_find_by_context(
     assert observations[0].content == sample_observation.content
 
 
+@pytest.mark.asyncio
+async def test_replace_entity_observations(
+    observation_repository: ObservationRepository,
+    sample_observation: Observation,
+    sample_entity: Entity,
+):
+    """Test replacing an entity's observations in one transaction"""
+    added = await observation_repository.replace_entity_observations(
+        sample_entity.id,
+        [
+            {"content": "First", "category": "tech", "context": None, "tags": ["a"]},
+            {"content": "Second", "category": None, "context": "why", "tags": None},
+        ],
+    )
+    assert added == 2
+
+    observations = await observation_repository.find_by_entity(sample_entity.id)
+    assert sorted(o.content for o in observations) == ["First", "Second"]
+    second = next(o for o in observations if o.content == "Second")
+    assert second.category == "note"
+    assert second.tags == []
+
+    # An empty list just clears the entity's observations
+    assert await observation_repository.replace_entity_observations(sample_entity.id, []) == 0
+    assert await observation_repository.find_by_entity(sample_entity.id) == []
+
+
 @pytest.mark.asyncio
 async def test_delete_observations(session_maker: async_sessionmaker, repo):
     """Test deleting observations by entity_id."""
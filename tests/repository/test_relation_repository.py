@@ -129,7 +129,7 @@ async def multiple_relations(
             "context": "context_three",
         },
     ]
-    return [await relation_repository.create(data) for data in relations_data]
+    return await relation_repository.create_all(relations_data)
 
 
 @pytest.mark.asyncio
@@ -201,6 +201,30 @@ async def test_find_by_type(relation_repository: RelationRepository, sample_rela
     assert relations[0].id == sample_relation.id
 
 
+@pytest.mark.asyncio
+async def test_find_by_type_loads_entities_in_one_query(
+    engine_factory, relation_repository: RelationRepository, multiple_relations
+):
+    """Test both ends of each relation are loaded by the relation query itself"""
+    engine, _ = engine_factory
+    statements = []
+
+    def count_statement(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    sqlalchemy.event.listen(engine.sync_engine, "before_cursor_execute", count_statement)
+    try:
+        relations = await relation_repository.find_by_type("relation_one")
+    finally:
+        sqlalchemy.event.remove(engine.sync_engine, "before_cursor_execute", count_statement)
+
+    assert len(relations) == 2
+    assert len([s for s in statements if s.lstrip().upper().startswith("SELECT")]) == 1
+    for relation in relations:
+        assert relation.from_entity.id == relation.from_id
+        assert relation.to_entity.id == relation.to_id
+
+
 @pytest.mark.asyncio
 async def test_find_unresolved_relations(
     relation_repository: RelationRepository, sample_entity: Entity, related_entity: Entity
@@ -347,3 +371,43 @@ async def test_delete_nonexistent_relation(relation_repository):
     """Test deleting a relation that doesn't exist."""
     result = await relation_repository.delete_by_fields(relation_type="nonexistent")
     assert result is False
+
+
+@pytest.mark.asyncio
+async def test_add_all_ignore_duplicates(
+    relation_repository: RelationRepository, source_entity, target_entity
+):
+    """Test bulk relation insert skips duplicates instead of failing."""
+    relations = [
+        {
+            "from_id": source_entity.id,
+            "to_id": target_entity.id,
+            "to_name": target_entity.title,
+            "relation_type": "connects_to",
+        },
+        {
+            "from_id": source_entity.id,
+            "to_id": target_entity.id,
+            "to_name": target_entity.title,
+            "relation_type": "connects_to",
+        },
+        {
+            "from_id": source_entity.id,
+            "to_id": None,
+            "to_name": "Missing Target",
+            "relation_type": "depends_on",
+            "context": "forward link",
+        },
+    ]
+
+    added = await relation_repository.add_all_ignore_duplicates(relations)
+    assert added == 2
+
+    # inserting the same relations again adds nothing
+    assert await relation_repository.add_all_ignore_duplicates(relations) == 0
+    assert await relation_repository.add_all_ignore_duplicates([]) == 0
+
+    found = await relation_repository.find_unresolved_relations()
+    assert len(found) == 1
+    assert found[0].to_name == "Missing Target"
+    assert found[0].context == "forward link"
@@ -41,6 +41,21 @@ async def test_find_connected_depth_limit(context_service, test_graph):
     assert (test_graph["deep"].id, "entity") in deep_entities
 
 
+@pytest.mark.asyncio
+async def test_find_connected_unique_items(context_service, test_graph):
+    """Test items reachable from several roots or paths are returned once, at their shallowest."""
+    type_id_pairs = [
+        ("entity", test_graph["connected1"].id),
+        ("entity", test_graph["connected2"].id),
+    ]
+    results = await context_service.find_related(type_id_pairs, max_depth=3, max_results=100)
+
+    keys = [(r.type, r.id) for r in results]
+    assert len(keys) == len(set(keys))
+    root = next(r for r in results if r.type == "entity" and r.id == test_graph["root"].id)
+    assert root.depth == 2
+
+
 @pytest.mark.asyncio
 async def test_find_connected_timeframe(context_service, test_graph, search_repository):
     """Test timeframe filtering.
@@ -50,53 +65,50 @@ async def test_find_connected_timeframe(context_service, test_graph, search_repo
     2. There is a valid path to them through other items in the timeframe
     """
     now = datetime.now(UTC)
-    old_date = now - timedelta(days=10)
-    recent_date = now - timedelta(days=1)
-
-    # Index root and its relation as old
-    await search_repository.index_item(
-        SearchIndexRow(
-            id=test_graph["root"].id,
-            title=test_graph["root"].title,
-            content_snippet="Root content",
-            permalink=test_graph["root"].permalink,
-            file_path=test_graph["root"].file_path,
-            type=SearchItemType.ENTITY,
-            metadata={"created_at": old_date.isoformat()},
-            created_at=old_date.isoformat(),
-            updated_at=old_date.isoformat(),
-        )
-    )
-    await search_repository.index_item(
-        SearchIndexRow(
-            id=test_graph["relations"][0].id,
-            title="Root Entity → Connected Entity 1",
-            content_snippet="",
-            permalink=f"{test_graph['root'].permalink}/connects_to/{test_graph['connected1'].permalink}",
-            file_path=test_graph["root"].file_path,
-            type=SearchItemType.RELATION,
-            from_id=test_graph["root"].id,
-            to_id=test_graph["connected1"].id,
-            relation_type="connects_to",
-            metadata={"created_at": old_date.isoformat()},
-            created_at=old_date.isoformat(),
-            updated_at=old_date.isoformat(),
-        )
-    )
-
-    # Index connected1 as recent
-    await search_repository.index_item(
-        SearchIndexRow(
-            id=test_graph["connected1"].id,
-            title=test_graph["connected1"].title,
-            content_snippet="Connected 1 content",
-            permalink=test_graph["connected1"].permalink,
-            file_path=test_graph["connected1"].file_path,
-            type=SearchItemType.ENTITY,
-            metadata={"created_at": recent_date.isoformat()},
-            created_at=recent_date.isoformat(),
-            updated_at=recent_date.isoformat(),
-        )
+    old_date = (now - timedelta(days=10)).isoformat()
+    recent_date = (now - timedelta(days=1)).isoformat()
+
+    await search_repository.bulk_index_items(
+        [
+            # Index root and its relation as old
+            SearchIndexRow(
+                id=test_graph["root"].id,
+                title=test_graph["root"].title,
+                content_snippet="Root content",
+                permalink=test_graph["root"].permalink,
+                file_path=test_graph["root"].file_path,
+                type=SearchItemType.ENTITY,
+                metadata={"created_at": old_date},
+                created_at=old_date,
+                updated_at=old_date,
+            ),
+            SearchIndexRow(
+                id=test_graph["relations"][0].id,
+                title="Root Entity → Connected Entity 1",
+                content_snippet="",
+                permalink=f"{test_graph['root'].permalink}/connects_to/{test_graph['connected1'].permalink}",
+                file_path=test_graph["root"].file_path,
+                type=SearchItemType.RELATION,
+                from_id=test_graph["root"].id,
+                to_id=test_graph["connected1"].id,
+                relation_type="connects_to",
+                metadata={"created_at": old_date},
+                created_at=old_date,
+                updated_at=old_date,
+            ),
+            # Index connected1 as recent
+            SearchIndexRow(
+                id=test_graph["connected1"].id,
+                title=test_graph["connected1"].title,
+                content_snippet="Connected 1 content",
+                permalink=test_graph["connected1"].permalink,
+                file_path=test_graph["connected1"].file_path,
+                type=SearchItemType.ENTITY,
+                metadata={"created_at": recent_date},
+                created_at=recent_date,
+                updated_at=recent_date,
+            ),
+        ]
     )
     type_id_pairs = [("entity", test_graph["root"].id)]
 
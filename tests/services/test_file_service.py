@@ -1,10 +1,13 @@
 """Tests for file operations service."""
 
+import os
+import time
 from pathlib import Path
 from unittest.mock import patch
 
 import pytest
 
+from basic_memory.file_utils import compute_checksum
 from basic_memory.services.exceptions import FileOperationError
 from basic_memory.services.file_service import FileService
 
@@ -162,3 +165,52 @@ async def test_write_unicode_content(tmp_path: Path, file_service: FileService):
     content, _ = await file_service.read_file(test_path)
 
     assert content == test_content
+
+
+@pytest.mark.asyncio
+async def test_compute_checksum_cache(tmp_path: Path, file_service: FileService):
+    """Test checksums are cached by modification time and size."""
+    test_path = tmp_path / "test.md"
+    test_path.write_text("first content\r\n")
+    checksum = await file_service.compute_checksum(test_path)
+
+    # markdown is hashed as text, with normalized line endings
+    assert checksum == await compute_checksum("first content\n")
+
+    # recently modified files are not cached
+    assert str(test_path) not in file_service.checksum_cache
+
+    # an older file is cached, same mtime and size is trusted without reading the file
+    old_time = time.time() - 60
+    os.utime(test_path, (old_time, old_time))
+    assert await file_service.compute_checksum(test_path) == checksum
+    test_path.write_text("other content\r\n")
+    os.utime(test_path, (old_time, old_time))
+    assert await file_service.compute_checksum(test_path) == checksum
+
+    # a new mtime is a cache miss
+    os.utime(test_path, (old_time + 1, old_time + 1))
+    assert await file_service.compute_checksum(test_path) == await compute_checksum(
+        "other content\n"
+    )
+
+    # binary files are hashed as raw bytes
+    binary_path = tmp_path / "image.png"
+    binary_path.write_bytes(b"\x89PNG\r\n")
+    assert await file_service.compute_checksum(binary_path) == await compute_checksum(
+        b"\x89PNG\r\n"
+    )
+
+
+@pytest.mark.asyncio
+async def test_delete_file_forgets_checksum(tmp_path: Path, file_service: FileService):
+    """Test deleting a file drops its checksum cache entry."""
+    test_path = tmp_path / "test.md"
+    test_path.write_text("content")
+    old_time = time.time() - 60
+    os.utime(test_path, (old_time, old_time))
+    await file_service.compute_checksum(test_path)
+    assert str(test_path) in file_service.checksum_cache
+
+    await file_service.delete_file(test_path)
+    assert str(test_path) not in file_service.checksum_cache
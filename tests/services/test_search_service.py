@@ -6,7 +6,11 @@ import pytest
 from sqlalchemy import text
 
 from basic_memory import db
+from basic_memory.models import Entity
+from basic_memory.repository.repository import IN_CLAUSE_CHUNK_SIZE
+from basic_memory.repository.search_repository import SearchIndexRow
 from basic_memory.schemas.search import SearchQuery, SearchItemType
+from basic_memory.services.search_service import AutoBatchIndexer
 
 
 @pytest.mark.asyncio
@@ -91,6 +95,54 @@ async def test_search_title(search_service, test_graph):
     assert results[0].permalink == "test/root"
 
 
+@pytest.mark.asyncio
+async def test_search_text_and_title(search_service, test_graph):
+    """Text and title criteria are applied together"""
+    results = await search_service.search(
+        SearchQuery(text="Entity", title="Root", entity_types=[SearchItemType.ENTITY])
+    )
+    assert [r.permalink for r in results] == ["test/root"]
+
+    results = await search_service.search(
+        SearchQuery(text="NonexistentTerm", title="Root", entity_types=[SearchItemType.ENTITY])
+    )
+    assert len(results) == 0
+
+
+@pytest.mark.asyncio
+async def test_text_search_ranks_title_matches_first(search_service, test_graph):
+    """A match in the title outranks matches in content"""
+    results = await search_service.search(
+        SearchQuery(text="Root", entity_types=[SearchItemType.ENTITY])
+    )
+    assert results[0].permalink == "test/root"
+    assert [r.score for r in results] == sorted(r.score for r in results)
+
+
+@pytest.mark.asyncio
+async def test_search_text_matches_per_column(search_service):
+    """All terms of a boolean text query must match in the title, or all in the content"""
+    now = datetime.now()
+    await search_service.repository.index_item(
+        SearchIndexRow(
+            id=1000,
+            type=SearchItemType.OBSERVATION.value,
+            file_path="test/columns.md",
+            permalink="test/columns/observations/1000",
+            title="alpha",
+            content_stems="beta",
+            created_at=now,
+            updated_at=now,
+        )
+    )
+
+    results = await search_service.search(SearchQuery(text="alpha"))
+    assert [r.permalink for r in results] == ["test/columns/observations/1000"]
+    results = await search_service.search(SearchQuery(text="beta"))
+    assert [r.permalink for r in results] == ["test/columns/observations/1000"]
+    assert len(await search_service.search(SearchQuery(text="alpha AND beta"))) == 0
+
+
 @pytest.mark.asyncio
 async def test_text_search_case_insensitive(search_service, test_graph):
     """Test text search functionality."""
@@ -343,3 +395,152 @@ async def test_boolean_operators_detection(search_service):
         assert not query.has_boolean_operators(), (
             f"Incorrectly detected boolean operators in: {query_text}"
         )
+
+
+@pytest.mark.asyncio
+async def test_index_entities(search_service, test_graph, entity_repository):
+    """Test indexing multiple entities in a single batch."""
+    entities = await entity_repository.find_all()
+
+    # Indexing again should replace existing rows rather than duplicate them
+    await search_service.index_entities(entities)
+
+    results = await search_service.search(SearchQuery(permalink="test/root"))
+    assert len(results) == 1
+
+    results = await search_service.search(SearchQuery(permalink_match="test/root/observations/*"))
+    assert len(results) == 2
+
+
+@pytest.mark.asyncio
+async def test_index_entities_empty(search_service):
+    """Test indexing an empty list of entities is a no-op."""
+    await search_service.index_entities([])
+    results = await search_service.search(SearchQuery(permalink_match="*"))
+    assert len(results) == 0
+
+
+@pytest.mark.asyncio
+async def test_index_entities_failure_keeps_existing_rows(search_service, test_graph):
+    """A failed reindex rolls back, leaving the entity's previous rows in place."""
+    root = test_graph["root"]
+    rows = await search_service.build_index_rows(root)
+    rows[0].metadata = {"unserializable": object()}
+
+    with pytest.raises(TypeError):
+        await search_service.repository.bulk_index_items(rows, entity_ids=[root.id])
+
+    results = await search_service.search(SearchQuery(permalink="test/root"))
+    assert len(results) == 1
+    results = await search_service.search(SearchQuery(permalink_match="test/root/observations/*"))
+    assert len(results) == 2
+
+
+@pytest.mark.asyncio
+async def test_build_index_rows_requires_markdown_permalink(search_service):
+    """A markdown entity without a permalink is rejected instead of indexed."""
+    entity = Entity(
+        id=1,
+        title="No Permalink",
+        entity_type="note",
+        content_type="text/markdown",
+        file_path="no-permalink.md",
+        permalink=None,
+    )
+    with pytest.raises(ValueError):
+        await search_service.build_index_rows(entity)
+
+
+@pytest.mark.asyncio
+async def test_delete_by_permalinks_chunked(search_service, test_graph):
+    """Permalink lists longer than one IN clause chunk are deleted in several statements."""
+    permalinks = [f"missing/{i}" for i in range(IN_CLAUSE_CHUNK_SIZE)] + ["test/root"]
+    await search_service.repository.delete_by_permalinks(permalinks)
+
+    assert len(await search_service.search(SearchQuery(permalink="test/root"))) == 0
+    results = await search_service.search(SearchQuery(permalink="test/connected-entity-1"))
+    assert len(results) == 1
+
+
+@pytest.mark.asyncio
+async def test_auto_batch_indexer(search_service, test_graph, entity_repository):
+    """Test queued entities are indexed in batches once flushed."""
+    await search_service.repository.delete_by_entity_ids(
+        [e.id for e in await entity_repository.find_all()]
+    )
+    assert len(await search_service.search(SearchQuery(permalink="test/root"))) == 0
+
+    indexer = AutoBatchIndexer(search_service, max_batch_size=2, debounce_duration=0.01)
+    entities = await entity_repository.find_all()
+    futures = [indexer.enqueue(entity) for entity in entities]
+    # queuing the same entity twice should not duplicate rows
+    futures.append(indexer.enqueue(test_graph["root"]))
+    await indexer.flush()
+    assert all(future.done() and future.exception() is None for future in futures)
+
+    results = await search_service.search(SearchQuery(permalink="test/root"))
+    assert len(results) == 1
+
+    results = await search_service.search(SearchQuery(permalink="test/connected-entity-1"))
+    assert len(results) == 1
+
+
+@pytest.mark.asyncio
+async def test_auto_batch_indexer_failed_batch(
+    search_service, test_graph, entity_repository, monkeypatch
+):
+    """A failed batch is indexed one entity at a time, and errors reach only their caller."""
+    await search_service.repository.delete_by_entity_ids(
+        [e.id for e in await entity_repository.find_all()]
+    )
+
+    async def fail_batch(entities, background_tasks=None):
+        raise RuntimeError("batch write failed")
+
+    monkeypatch.setattr(search_service, "index_entities", fail_batch)
+    indexer = AutoBatchIndexer(search_service, debounce_duration=0.01)
+
+    # every entity of the failed batch is still indexed
+    root = indexer.enqueue(test_graph["root"])
+    connected1 = indexer.enqueue(test_graph["connected1"])
+    await root
+    await connected1
+    assert len(await search_service.search(SearchQuery(permalink="test/root"))) == 1
+    assert len(await search_service.search(SearchQuery(permalink="test/connected-entity-1"))) == 1
+
+    # an entity that cannot be indexed on its own fails only its own future
+    index_entity = search_service.index_entity
+
+    async def fail_root(entity, background_tasks=None):
+        if entity.id == test_graph["root"].id:
+            raise RuntimeError("entity write failed")
+        await index_entity(entity)
+
+    monkeypatch.setattr(search_service, "index_entity", fail_root)
+    root = indexer.enqueue(test_graph["root"])
+    connected2 = indexer.enqueue(test_graph["connected2"])
+    await indexer.flush()
+    with pytest.raises(RuntimeError, match="entity write failed"):
+        await root
+    await connected2
+    assert len(await search_service.search(SearchQuery(permalink="test/connected-entity-2"))) == 1
+
+
+@pytest.mark.asyncio
+async def test_delete_entities(search_service, test_graph, entity_repository):
+    """Test deleting entities removes their rows and incoming relations from the index."""
+    connected_1 = await entity_repository.get_by_permalink("test/connected-entity-1")
+    await search_service.delete_entities([connected_1])
+
+    results = await search_service.search(SearchQuery(permalink_match="test/connected-entity-1*"))
+    assert len(results) == 0
+
+    # the root -> connected 1 relation is indexed under root but points at the deleted entity
+    results = await search_service.search(SearchQuery(permalink_match="test/root/connects-to/*"))
+    assert len(results) == 0
+
+    # other entities are untouched
+    results = await search_service.search(SearchQuery(permalink_match="test/root/observations/*"))
+    assert len(results) == 2
+
+    await search_service.delete_entities([])
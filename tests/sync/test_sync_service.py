@@ -1,20 +1,31 @@
 """Test general sync behavior."""
 
 import asyncio
+import os
+import time
 from datetime import datetime, timezone
 from pathlib import Path
+from textwrap import dedent
 
 import pytest
+import pytest_asyncio
 
 from basic_memory.config import ProjectConfig
 from basic_memory.models import Entity
 from basic_memory.repository import EntityRepository
+from basic_memory.schemas import Entity as EntitySchema
 from basic_memory.schemas.search import SearchQuery
 from basic_memory.services import EntityService, FileService
 from basic_memory.services.search_service import SearchService
 from basic_memory.sync.sync_service import SyncService
 
 
+KNOWLEDGE_FRONTMATTER = "---\ntype: knowledge\n---\n"
+DATED_KNOWLEDGE_FRONTMATTER = (
+    "---\ntype: knowledge\npermalink: {permalink}\ncreated: 2024-01-01\nmodified: 2024-01-01\n---\n"
+)
+
+
 async def create_test_file(path: Path, content: str = "test content") -> None:
     """Create a test file with given content."""
     path.parent.mkdir(parents=True, exist_ok=True)
@@ -31,11 +42,7 @@ async def test_forward_reference_resolution(
     project_dir = test_config.home
 
     # First create a file with a forward reference
-    source_content = """
----
-type: knowledge
----
-# Source Document
+    source_content = f"""{KNOWLEDGE_FRONTMATTER}# Source Document
 
 ## Relations
 - depends_on [[target-doc]]
@@ -53,11 +60,7 @@ type: knowledge
     assert source.relations[0].to_name == "target-doc"
 
     # Now create the target file
-    target_content = """
----
-type: knowledge
----
-# Target Doc
+    target_content = f"""{KNOWLEDGE_FRONTMATTER}# Target Doc
 Target content
 """
     await create_test_file(project_dir / "target_doc.md", target_content)
@@ -72,6 +75,13 @@ Target content
     assert source.relations[0].to_id == target.id
     assert source.relations[0].to_name == target.title
 
+    # The source entity owns the relation's index row, so it is reindexed with the target
+    results = await sync_service.search_service.search(
+        SearchQuery(permalink_match="source/depends-on/*")
+    )
+    assert [r.permalink for r in results] == ["source/depends-on/target-doc"]
+    assert results[0].to_id == target.id
+
 
 @pytest.mark.asyncio
 async def test_sync(
@@ -82,14 +92,9 @@ async def test_sync(
     project_dir = test_config.home
 
     # New entity with relation
-    new_content = """
----
-type: knowledge
-permalink: concept/test-concept
-created: 2023-01-01
-modified: 2023-01-01
----
-# Test Concept
+    new_content = (
+        DATED_KNOWLEDGE_FRONTMATTER.format(permalink="concept/test-concept")
+        + """# Test Concept
 
 A test concept.
 
@@ -99,6 +104,7 @@ A test concept.
 ## Relations
 - depends_on [[concept/other]]
 """
+    )
     await create_test_file(project_dir / "concept/test_concept.md", new_content)
 
     # Create related entity in DB that will be deleted
@@ -119,11 +125,11 @@ A test concept.
     await sync_service.sync(test_config.home, show_progress=False)
 
     # Verify results
-    entities = await entity_service.repository.find_all()
-    assert len(entities) == 1
+    assert await entity_service.repository.count() == 1
 
     # Find new entity
-    test_concept = next(e for e in entities if e.permalink == "concept/test-concept")
+    test_concept = await entity_service.repository.get_by_permalink("concept/test-concept")
+    assert test_concept is not None
     assert test_concept.entity_type == "knowledge"
 
     # Verify relation was created
@@ -149,8 +155,7 @@ async def test_sync_hidden_file(
     await sync_service.sync(test_config.home, show_progress=False)
 
     # Verify results
-    entities = await entity_service.repository.find_all()
-    assert len(entities) == 0
+    assert await entity_service.repository.count() == 0
 
 
 @pytest.mark.asyncio
@@ -161,14 +166,9 @@ async def test_sync_entity_with_nonexistent_relations(
     project_dir = test_config.home
 
     # Create entity that references entities we haven't created yet
-    content = """
----
-type: knowledge
-permalink: concept/depends-on-future
-created: 2024-01-01
-modified: 2024-01-01
----
-# Test Dependencies
+    content = (
+        DATED_KNOWLEDGE_FRONTMATTER.format(permalink="concept/depends-on-future")
+        + """# Test Dependencies
 
 ## Observations
 - [design] Testing future dependencies
@@ -177,6 +177,7 @@ modified: 2024-01-01
 - depends_on [[concept/not_created_yet]]
 - uses [[concept/also_future]]
 """
+    )
     await create_test_file(project_dir / "concept/depends_on_future.md", content)
 
     # Sync
@@ -200,14 +201,9 @@ async def test_sync_entity_circular_relations(
     project_dir = test_config.home
 
     # Create entity A that depends on B
-    content_a = """
----
-type: knowledge
-permalink: concept/entity-a
-created: 2024-01-01
-modified: 2024-01-01
----
-# Entity A
+    content_a = (
+        DATED_KNOWLEDGE_FRONTMATTER.format(permalink="concept/entity-a")
+        + """# Entity A
 
 ## Observations
 - First entity in circular reference
@@ -215,17 +211,13 @@ modified: 2024-01-01
 ## Relations
 - depends_on [[concept/entity-b]]
 """
+    )
     await create_test_file(project_dir / "concept/entity_a.md", content_a)
 
     # Create entity B that depends on A
-    content_b = """
----
-type: knowledge
-permalink: concept/entity-b
-created: 2024-01-01
-modified: 2024-01-01
----
-# Entity B
+    content_b = (
+        DATED_KNOWLEDGE_FRONTMATTER.format(permalink="concept/entity-b")
+        + """# Entity B
 
 ## Observations
 - Second entity in circular reference
@@ -233,6 +225,7 @@ modified: 2024-01-01
 ## Relations
 - depends_on [[concept/entity-a]]
 """
+    )
     await create_test_file(project_dir / "concept/entity_b.md", content_b)
 
     # Sync
@@ -270,30 +263,21 @@ async def test_sync_entity_duplicate_relations(
     project_dir = test_config.home
 
     # Create target entity first
-    target_content = """
----
-type: knowledge
-permalink: concept/target
-created: 2024-01-01
-modified: 2024-01-01
----
-# Target Entity
+    target_content = (
+        DATED_KNOWLEDGE_FRONTMATTER.format(permalink="concept/target")
+        + """# Target Entity
 
 ## Observations
 - something to observe
 
 """
+    )
     await create_test_file(project_dir / "concept/target.md", target_content)
 
     # Create entity with duplicate relations
-    content = """
----
-type: knowledge
-permalink: concept/duplicate-relations
-created: 2024-01-01
-modified: 2024-01-01
----
-# Test Duplicates
+    content = (
+        DATED_KNOWLEDGE_FRONTMATTER.format(permalink="concept/duplicate-relations")
+        + """# Test Duplicates
 
 ## Observations
 - this has a lot of relations
@@ -304,6 +288,7 @@ modified: 2024-01-01
 - uses [[concept/target]]  # Different relation type
 - uses [[concept/target]]  # Duplicate of different type
 """
+    )
     await create_test_file(project_dir / "concept/duplicate_relations.md", content)
 
     # Sync
@@ -331,14 +316,9 @@ async def test_sync_entity_with_random_categories(
     """Test handling of random observation categories."""
     project_dir = test_config.home
 
-    content = """
----
-type: knowledge
-permalink: concept/invalid-category
-created: 2024-01-01
-modified: 2024-01-01
----
-# Test Categories
+    content = (
+        DATED_KNOWLEDGE_FRONTMATTER.format(permalink="concept/invalid-category")
+        + """# Test Categories
 
 ## Observations
 - [random category] This is fine
@@ -346,6 +326,7 @@ modified: 2024-01-01
 - This one is not an observation, should be ignored
 - [design] This is valid 
 """
+    )
     await create_test_file(project_dir / "concept/invalid_category.md", content)
 
     # Sync
@@ -375,14 +356,8 @@ async def test_sync_entity_with_order_dependent_relations(
 
     # Create several interrelated entities
     entities = {
-        "a": """
----
-type: knowledge
-permalink: concept/entity-a
-created: 2024-01-01
-modified: 2024-01-01
----
-# Entity A
+        "a": DATED_KNOWLEDGE_FRONTMATTER.format(permalink="concept/entity-a")
+        + """# Entity A
 
 ## Observations
 - depends on b
@@ -392,14 +367,8 @@ modified: 2024-01-01
 - depends_on [[concept/entity-b]]
 - depends_on [[concept/entity-c]]
 """,
-        "b": """
----
-type: knowledge
-permalink: concept/entity-b
-created: 2024-01-01
-modified: 2024-01-01
----
-# Entity B
+        "b": DATED_KNOWLEDGE_FRONTMATTER.format(permalink="concept/entity-b")
+        + """# Entity B
 
 ## Observations
 - depends on c
@@ -407,14 +376,8 @@ modified: 2024-01-01
 ## Relations
 - depends_on [[concept/entity-c]]
 """,
-        "c": """
----
-type: knowledge
-permalink: concept/entity-c
-created: 2024-01-01
-modified: 2024-01-01
----
-# Entity C
+        "c": DATED_KNOWLEDGE_FRONTMATTER.format(permalink="concept/entity-c")
+        + """# Entity C
 
 ## Observations
 - depends on a
@@ -457,30 +420,34 @@ async def test_sync_empty_directories(sync_service: SyncService, test_config: Pr
 
 @pytest.mark.asyncio
 async def test_sync_file_modified_during_sync(
-    sync_service: SyncService, test_config: ProjectConfig
+    sync_service: SyncService, test_config: ProjectConfig, monkeypatch
 ):
     """Test handling of files that change during sync process."""
     # Create initial files
     doc_path = test_config.home / "changing.md"
     await create_test_file(
         doc_path,
-        """
----
-type: knowledge
-id: changing
-created: 2024-01-01
-modified: 2024-01-01
----
-# Knowledge File
+        DATED_KNOWLEDGE_FRONTMATTER.format(permalink="changing")
+        + """# Knowledge File
 
 ## Observations
 - This is a test
 """,
     )
 
+    # Signal when sync starts scanning
+    started = asyncio.Event()
+    scan = sync_service.scan
+
+    async def signalling_scan(directory):
+        started.set()
+        return await scan(directory)
+
+    monkeypatch.setattr(sync_service, "scan", signalling_scan)
+
     # Setup async modification during sync
     async def modify_file():
-        await asyncio.sleep(0.1)  # Small delay to ensure sync has started
+        await started.wait()
         doc_path.write_text("Modified during sync")
 
     # Run sync and modification concurrently
@@ -497,6 +464,185 @@ modified: 2024-01-01
         assert doc.checksum is not None
 
 
+@pytest.mark.asyncio
+async def test_sync_pipeline_small_queue(sync_service: SyncService, test_config: ProjectConfig):
+    """Test the parse/write pipeline keeps every file when parsing is throttled."""
+    sync_service.parse_queue_size = 2
+    for i in range(10):
+        await create_test_file(
+            test_config.home / f"pipeline/note-{i}.md",
+            f"# Note {i}\n\n- [note] observation {i}\n- links_to [[Note {(i + 1) % 10}]]\n",
+        )
+    await create_test_file(test_config.home / "pipeline/data.txt", "plain text")
+
+    await sync_service.sync(test_config.home, show_progress=False)
+
+    entities = await sync_service.entity_repository.find_all()
+    assert len(entities) == 11
+    for entity in entities:
+        assert entity.checksum is not None
+    note = await sync_service.entity_repository.get_by_permalink("pipeline/note-0")
+    assert len(note.observations) == 1
+    assert note.outgoing_relations[0].to_id is not None
+
+
+@pytest.mark.asyncio
+async def test_sync_file_edited_after_parse(
+    sync_service: SyncService, test_config: ProjectConfig, monkeypatch
+):
+    """Test an edit made after a file was parsed ahead is picked up by the next sync."""
+    path = test_config.home / "edited.md"
+    await create_test_file(path, "---\npermalink: edited\n---\n\n- [note] before edit\n")
+
+    parse_markdown_file = sync_service.parse_markdown_file
+
+    async def parse_then_edit(file_path):
+        parsed = await parse_markdown_file(file_path)
+        path.write_text("---\npermalink: edited\n---\n\n- [note] after edit\n")
+        return parsed
+
+    monkeypatch.setattr(sync_service, "parse_markdown_file", parse_then_edit)
+    await sync_service.sync(test_config.home, show_progress=False)
+    monkeypatch.undo()
+
+    # the stored checksum matches the parsed content, not the edited file
+    report = await sync_service.scan(test_config.home)
+    assert report.modified == {"edited.md"}
+
+    await sync_service.sync(test_config.home, show_progress=False)
+    entity = await sync_service.entity_repository.get_by_file_path("edited.md")
+    assert [o.content for o in entity.observations] == ["after edit"]
+
+
+@pytest.mark.asyncio
+async def test_sync_files_parse_stage_cancelled(
+    sync_service: SyncService, test_config: ProjectConfig, monkeypatch
+):
+    """Test the write stage fails instead of waiting forever when parsing stops."""
+    await create_test_file(test_config.home / "note.md", "content")
+
+    async def cancelled(files, queue):
+        raise asyncio.CancelledError()
+
+    monkeypatch.setattr(sync_service, "parse_markdown_files", cancelled)
+    with pytest.raises(RuntimeError, match="File parsing stopped"):
+        await asyncio.wait_for(sync_service.sync_files([("note.md", True)]), timeout=5)
+
+
+@pytest.mark.asyncio
+async def test_sync_reports_search_index_failures(
+    sync_service: SyncService, test_config: ProjectConfig, monkeypatch
+):
+    """Test a sync reports every entity it could not index, after syncing the rest."""
+    for name in ("good", "bad-1", "bad-2"):
+        await create_test_file(test_config.home / f"{name}.md", f"# {name}")
+
+    index_entity = sync_service.search_service.index_entity
+
+    async def fail_batch(entities, background_tasks=None):
+        raise RuntimeError("batch write failed")
+
+    async def fail_bad_entity(entity, background_tasks=None):
+        if entity.file_path.startswith("bad"):
+            raise RuntimeError(f"cannot index {entity.file_path}")
+        await index_entity(entity)
+
+    monkeypatch.setattr(sync_service.search_service, "index_entities", fail_batch)
+    monkeypatch.setattr(sync_service.search_service, "index_entity", fail_bad_entity)
+
+    with pytest.raises(ExceptionGroup) as exc_info:
+        await sync_service.sync(test_config.home, show_progress=False)
+    messages = sorted(str(e) for e in exc_info.value.exceptions)
+    assert messages == ["cannot index bad-1.md", "cannot index bad-2.md"]
+
+    results = await sync_service.search_service.search(SearchQuery(permalink="good"))
+    assert len(results) == 1
+
+
+@pytest.mark.asyncio
+async def test_scan_directory(sync_service: SyncService, test_config: ProjectConfig):
+    """Test scanning skips dot files and directories and hashes every other file."""
+    project_dir = test_config.home
+    sync_service.scan_concurrency = 2
+    for i in range(5):
+        await create_test_file(project_dir / f"scan/nested/note-{i}.md", f"# Note {i}")
+    await create_test_file(project_dir / "scan/data.txt", "plain text")
+    await create_test_file(project_dir / "scan/.hidden.md", "# Hidden")
+    await create_test_file(project_dir / ".obsidian/config.md", "# Config")
+
+    result = await sync_service.scan_directory(project_dir)
+
+    expected = {f"scan/nested/note-{i}.md" for i in range(5)} | {"scan/data.txt"}
+    assert set(result.files) == expected
+    for path, checksum in result.files.items():
+        assert checksum == await sync_service.file_service.compute_checksum(path)
+        assert result.checksums[checksum] == path
+
+
+@pytest.mark.asyncio
+async def test_sync_skips_hashing_unchanged_files(
+    sync_service: SyncService, test_config: ProjectConfig
+):
+    """Test files with the modification time and size stored at sync are not hashed again."""
+    project_dir = test_config.home
+    old_time = time.time() - 60
+    for name in ("note.md", "data.txt"):
+        await create_test_file(project_dir / "stat" / name, "same size content")
+        os.utime(project_dir / "stat" / name, (old_time, old_time))
+    await create_test_file(
+        project_dir / "stat/linked.md", "---\npermalink: stat/linked\n---\n\nlinked content\n"
+    )
+    os.utime(project_dir / "stat/linked.md", (old_time, old_time))
+
+    await sync_service.sync(project_dir, show_progress=False)
+    entity = await sync_service.entity_repository.get_by_file_path("stat/data.txt")
+    assert entity.mtime_ns == (project_dir / "stat/data.txt").stat().st_mtime_ns
+    assert entity.size == len("same size content")
+
+    # markdown checksummed from the parsed text records the stat it was read at
+    entity = await sync_service.entity_repository.get_by_file_path("stat/linked.md")
+    assert entity.mtime_ns == (project_dir / "stat/linked.md").stat().st_mtime_ns
+
+    # rewrite with the same size and mtime, only a hash would tell the difference
+    (project_dir / "stat/data.txt").write_text("edit size content")
+    os.utime(project_dir / "stat/data.txt", (old_time, old_time))
+
+    # a fresh process has no cache, checksums come from the database
+    sync_service.file_service.checksum_cache.clear()
+    report = await sync_service.scan(project_dir)
+    assert report.total == 0
+
+    # a new modification time is hashed again
+    os.utime(project_dir / "stat/data.txt", (old_time + 1, old_time + 1))
+    report = await sync_service.scan(project_dir)
+    assert report.modified == {"stat/data.txt"}
+
+
+@pytest.mark.asyncio
+async def test_sync_forgets_checksums_of_removed_files(
+    sync_service: SyncService, test_config: ProjectConfig
+):
+    """Test deleted and moved files don't keep entries in the checksum cache."""
+    project_dir = test_config.home
+    old_time = time.time() - 60
+    for name in ("deleted.md", "moved.md"):
+        await create_test_file(project_dir / name, f"{KNOWLEDGE_FRONTMATTER}# {name}\n")
+        os.utime(project_dir / name, (old_time, old_time))
+    await sync_service.sync(project_dir, show_progress=False)
+    cache = sync_service.file_service.checksum_cache
+    assert str(project_dir / "deleted.md") in cache
+    assert str(project_dir / "moved.md") in cache
+
+    (project_dir / "deleted.md").unlink()
+    (project_dir / "moved.md").rename(project_dir / "renamed.md")
+    report = await sync_service.sync(project_dir, show_progress=False)
+    assert report.deleted == {"deleted.md"}
+    assert report.moves == {"moved.md": "renamed.md"}
+
+    assert str(project_dir / "deleted.md") not in cache
+    assert str(project_dir / "moved.md") not in cache
+
+
 @pytest.mark.asyncio
 async def test_permalink_formatting(
     sync_service: SyncService, test_config: ProjectConfig, entity_service: EntityService
@@ -514,43 +660,60 @@ async def test_permalink_formatting(
     }
 
     # Create test files
-    for filename, _ in test_files.items():
-        content: str = """
----
-type: knowledge
-created: 2024-01-01
-modified: 2024-01-01
----
-# Test File
+    for filename in test_files:
+        content = f"""{KNOWLEDGE_FRONTMATTER}# Test File
 
 Testing permalink generation.
 """
         await create_test_file(test_config.home / filename, content)
 
-        # Run sync
-        await sync_service.sync(test_config.home, show_progress=False)
+    # One sync picks up all the files
+    await sync_service.sync(test_config.home, show_progress=False)
 
     # Verify permalinks
-    entities = await entity_service.repository.find_all()
     for filename, expected_permalink in test_files.items():
-        # Find entity for this file
-        entity = next(e for e in entities if e.file_path == filename)
+        entity = await entity_service.repository.get_by_file_path(filename)
         assert entity.permalink == expected_permalink, (
             f"File {filename} should have permalink {expected_permalink}"
         )
 
 
+@pytest_asyncio.fixture
+async def root_entity(entity_service: EntityService, search_service: SearchService) -> Entity:
+    """Create a root entity with one observation and one relation, indexed for search."""
+    target, _ = await entity_service.create_or_update_entity(
+        EntitySchema(title="Connected Entity 1", entity_type="test", folder="test")
+    )
+    root, _ = await entity_service.create_or_update_entity(
+        EntitySchema(
+            title="Root",
+            entity_type="test",
+            folder="test",
+            content=dedent("""
+                # Root Entity
+                - [note] Root note 1
+                - connects_to [[Connected Entity 1]]
+                """),
+        )
+    )
+    await search_service.index_entities(
+        await entity_service.get_entities_by_id([target.id, root.id])
+    )
+    return root
+
+
 @pytest.mark.asyncio
 async def test_handle_entity_deletion(
-    test_graph,
+    root_entity: Entity,
     sync_service: SyncService,
     test_config: ProjectConfig,
     entity_repository: EntityRepository,
     search_service: SearchService,
 ):
     """Test deletion of entity cleans up search index."""
+    # the root's rows are indexed before deletion
+    assert len(await search_service.search(SearchQuery(text="connects_to"))) == 1
 
-    root_entity = test_graph["root"]
     # Delete the entity
     await sync_service.handle_delete(root_entity.file_path)
 
@@ -578,21 +741,13 @@ async def test_sync_preserves_timestamps(
     project_dir = test_config.home
 
     # Create a file with explicit frontmatter dates
-    frontmatter_content = """
----
-type: knowledge
----
-# Explicit Dates
+    frontmatter_content = f"""{KNOWLEDGE_FRONTMATTER}# Explicit Dates
 Testing frontmatter dates
 """
     await create_test_file(project_dir / "explicit_dates.md", frontmatter_content)
 
     # Create a file without dates (will use file timestamps)
-    file_dates_content = """
----
-type: knowledge
----
-# File Dates
+    file_dates_content = f"""{KNOWLEDGE_FRONTMATTER}# File Dates
 Testing file timestamps
 """
     file_path = project_dir / "file_dates.md"
@@ -627,15 +782,10 @@ async def test_file_move_updates_search_index(
     project_dir = test_config.home
 
     # Create initial file
-    content = """
----
-type: knowledge
----
-# Test Move
+    content = f"""{KNOWLEDGE_FRONTMATTER}# Test Move
 Content for move test
 """
     old_path = project_dir / "old" / "test_move.md"
-    old_path.parent.mkdir(parents=True)
     await create_test_file(old_path, content)
 
     # Initial sync
@@ -674,18 +824,14 @@ async def test_sync_null_checksum_cleanup(
     await entity_service.repository.add(entity)
 
     # Create corresponding file
-    content = """
----
-type: knowledge
-id: concept/incomplete
-created: 2024-01-01
-modified: 2024-01-01
----
-# Incomplete Entity
+    content = (
+        DATED_KNOWLEDGE_FRONTMATTER.format(permalink="concept/incomplete")
+        + """# Incomplete Entity
 
 ## Observations
 - Testing cleanup
 """
+    )
     await create_test_file(test_config.home / "concept/incomplete.md", content)
 
     # Run sync
@@ -706,15 +852,10 @@ async def test_sync_permalink_resolved(
     project_dir = test_config.home
 
     # Create initial file
-    content = """
----
-type: knowledge
----
-# Test Move
+    content = f"""{KNOWLEDGE_FRONTMATTER}# Test Move
 Content for move test
 """
     old_path = project_dir / "old" / "test_move.md"
-    old_path.parent.mkdir(parents=True)
     await create_test_file(old_path, content)
 
     # Initial sync
@@ -732,16 +873,13 @@ Content for move test
     assert "permalink: old/test-move" in file_content
 
     # Create another that has the same permalink
-    content = """
----
-type: knowledge
-permalink: old/test-move
----
-# Test Move
+    content = (
+        DATED_KNOWLEDGE_FRONTMATTER.format(permalink="old/test-move")
+        + """# Test Move
 Content for move test
 """
+    )
     old_path = project_dir / "old" / "test_move.md"
-    old_path.parent.mkdir(parents=True, exist_ok=True)
     await create_test_file(old_path, content)
 
     # Sync new file
@@ -949,7 +1087,7 @@ async def test_sync_non_markdown_files_deleted(sync_service, test_config, test_f
     assert len(report2.deleted) == 1
 
     # Verify entity is deleted
-    pdf_entity = await sync_service.entity_repository.get_by_file_path("moved_pdf.pdf")
+    pdf_entity = await sync_service.entity_repository.get_by_file_path(test_files["pdf"].name)
     assert pdf_entity is None
 
 
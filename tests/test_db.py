@@ -0,0 +1,31 @@
+"""Tests for database engine setup."""
+
+import pytest
+from sqlalchemy import text
+
+from basic_memory import db
+from basic_memory.db import DatabaseType
+
+
+@pytest.mark.asyncio
+async def test_file_database_pragmas(tmp_path):
+    """File databases use WAL and enforce foreign keys on every connection."""
+    async with db.engine_session_factory(
+        tmp_path / "memory.db", db_type=DatabaseType.FILESYSTEM
+    ) as (engine, session_maker):
+        async with db.scoped_session(session_maker) as session:
+            assert (await session.execute(text("PRAGMA journal_mode"))).scalar() == "wal"
+            assert (await session.execute(text("PRAGMA synchronous"))).scalar() == 1  # NORMAL
+            assert (await session.execute(text("PRAGMA foreign_keys"))).scalar() == 1
+
+
+@pytest.mark.asyncio
+async def test_memory_database_pragmas(tmp_path):
+    """In-memory databases enforce foreign keys without the file settings."""
+    async with db.engine_session_factory(tmp_path / "memory.db", db_type=DatabaseType.MEMORY) as (
+        engine,
+        session_maker,
+    ):
+        async with db.scoped_session(session_maker) as session:
+            assert (await session.execute(text("PRAGMA foreign_keys"))).scalar() == 1
+            assert (await session.execute(text("PRAGMA journal_mode"))).scalar() == "memory"